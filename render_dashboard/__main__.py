@@ -2,9 +2,6 @@
 import sys
 from pathlib import Path
 from typing import Optional
-from .cli import handle_cli_command
-from .ui import run_dashboard
-from .service_manager import handle_service_management
 
 
 def extract_config_arg(args: list[str]) -> tuple[Optional[Path], list[str]]:
@@ -16,14 +13,19 @@ def extract_config_arg(args: list[str]) -> tuple[Optional[Path], list[str]]:
     Returns:
         Tuple of (config_path, remaining_args)
     """
+    # One C-level scan; the common no-flag case short-circuits immediately
+    if "--config" not in args:
+        return None, args
+
+    # Consume every --config/value pair (last one wins); a trailing
+    # --config without a value is passed through in remaining_args
     config_path = None
     remaining_args = []
     i = 0
-
     while i < len(args):
         if args[i] == "--config" and i + 1 < len(args):
             config_path = Path(args[i + 1])
-            i += 2  # Skip both --config and its value
+            i += 2
         else:
             remaining_args.append(args[i])
             i += 1
@@ -50,14 +52,19 @@ def main() -> int:
     # Extract --config argument
     config_path, args = extract_config_arg(args)
 
+    # Imports are deferred per-branch so CLI commands don't pay for the
+    # Textual/Rich stack and the TUI doesn't pay for CLI-only modules
     if len(args) == 0:
         # No arguments - run TUI dashboard
+        from .ui import run_dashboard
         return run_dashboard(config_path=config_path)
     elif args[0] == "service":
         # Service management commands
+        from .service_manager import handle_service_management
         return handle_service_management(args[1:], config_path=config_path)
     else:
         # CLI command mode (rdash <service> <action>)
+        from .cli import handle_cli_command
         return handle_cli_command(args, config_path=config_path)
 
 
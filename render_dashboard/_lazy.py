@@ -0,0 +1,29 @@
+"""Lazy module loading for startup-sensitive code paths."""
+import importlib
+from typing import Any
+
+
+class LazyModule:
+    """Proxy that imports its target module on first attribute access.
+
+    Lets CLI entry points reference heavy modules (HTTP client, UI stack)
+    without paying their import cost on commands that never touch them.
+    """
+
+    def __init__(self, name: str):
+        self._name = name
+        self._mod = None
+
+    def __getattr__(self, attr: str) -> Any:
+        if self._mod is None:
+            self._mod = importlib.import_module(self._name)
+        return getattr(self._mod, attr)
+
+
+def lazy_import(name: str) -> LazyModule:
+    """Return a proxy for module ``name`` that defers the import to first use.
+
+    Args:
+        name: Absolute module name, e.g. "render_dashboard.api"
+    """
+    return LazyModule(name)
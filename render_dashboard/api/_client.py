@@ -0,0 +1,73 @@
+"""Shared httpx client for the Render API.
+
+A single pooled ``httpx.AsyncClient`` is reused across all ``RenderClient``
+instances so repeated CLI calls and dashboard refreshes reuse keep-alive
+connections instead of paying a fresh TCP+TLS handshake per request.
+"""
+import asyncio
+import atexit
+from typing import Optional
+
+import httpx
+
+BASE_URL = "https://api.render.com/v1"
+
+# Connection pool sizing: enough parallelism for a full dashboard refresh,
+# with keep-alive connections held long enough to span refresh intervals.
+_LIMITS = httpx.Limits(
+    max_connections=100,
+    max_keepalive_connections=20,
+    keepalive_expiry=300,
+)
+
+_client: Optional[httpx.AsyncClient] = None
+_client_loop: Optional[asyncio.AbstractEventLoop] = None
+
+
+def get_http_client() -> httpx.AsyncClient:
+    """Get or create the shared AsyncClient.
+
+    Must be called from within a running event loop. If the loop has changed
+    since the client was created (e.g. separate ``asyncio.run`` invocations
+    in one process), a fresh client is created because pooled connections
+    are bound to the loop they were opened on.
+    """
+    global _client, _client_loop
+
+    loop = asyncio.get_running_loop()
+    if _client is None or _client.is_closed or _client_loop is not loop:
+        _client = httpx.AsyncClient(
+            base_url=BASE_URL,
+            limits=_LIMITS,
+            timeout=30.0,
+            # HTTP/2 multiplexes the dashboard's concurrent fetches over one
+            # TLS connection instead of queueing on HTTP/1.1 sockets
+            http2=True,
+            # Retry connection establishment a couple of times at the
+            # transport level rather than in Python retry loops
+            transport=httpx.AsyncHTTPTransport(retries=2, limits=_LIMITS, http2=True),
+        )
+        _client_loop = loop
+    return _client
+
+
+async def close_http_client() -> None:
+    """Close the shared client and release pooled connections."""
+    global _client, _client_loop
+    if _client is not None and not _client.is_closed:
+        await _client.aclose()
+    _client = None
+    _client_loop = None
+
+
+def _close_at_exit() -> None:
+    """Best-effort cleanup of the shared client at interpreter shutdown."""
+    if _client is not None and not _client.is_closed:
+        try:
+            asyncio.run(close_http_client())
+        except RuntimeError:
+            # Event loop already closed/running; sockets are reclaimed by the OS
+            pass
+
+
+atexit.register(_close_at_exit)
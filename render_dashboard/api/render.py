@@ -1,11 +1,27 @@
 """Async client for Render API."""
-import httpx
+import asyncio
+from dataclasses import replace
 from datetime import datetime
-from typing import Optional
-from dateutil import parser as dateparser
+from typing import AsyncIterator, Optional
+
+import httpx
 
-from ..models import Service, Deploy, ServiceStatus, DeployStatus, EnvVar
 from ..cache import SimpleCache
+from ..models import Deploy, DeployStatus, EnvVar, Service, ServiceStatus
+from ._client import get_http_client
+
+try:
+    # Optional speedup for response decoding (see cache.py for the same shim)
+    from orjson import loads as _json_loads
+except ImportError:
+    from json import loads as _json_loads
+
+try:
+    # Optional: incremental JSON parsing lets large /services responses be
+    # processed as bytes arrive instead of buffering the whole body
+    import ijson as _ijson
+except ImportError:
+    _ijson = None
 
 
 class RenderAPIError(Exception):
@@ -13,49 +29,76 @@ class RenderAPIError(Exception):
     pass
 
 
-class RenderClient:
-    """Async client for Render API."""
+# Fixed messages for well-known error statuses; codes needing request
+# context are formatted in _request itself
+_ERROR_MESSAGES = {
+    401: "Authentication failed. Check your RENDER_API_KEY is correct.",
+    429: "Rate limit exceeded. Please wait before refreshing.",
+}
 
-    BASE_URL = "https://api.render.com/v1"
+# Map Render API status to our enum (module-level so it isn't rebuilt per call)
+_STATUS_MAP = {
+    "available": ServiceStatus.AVAILABLE,
+    "deploying": ServiceStatus.DEPLOYING,
+    "suspended": ServiceStatus.SUSPENDED,
+    "failed": ServiceStatus.FAILED,
+    "unavailable": ServiceStatus.FAILED,
+}
 
-    # Shared cache instance for service list (5 min TTL)
-    _cache: Optional[SimpleCache] = None
 
-    @classmethod
-    def _get_cache(cls) -> SimpleCache:
-        """Get or create the shared cache instance."""
-        if cls._cache is None:
-            cls._cache = SimpleCache(ttl=300)
-        return cls._cache
+class RenderClient:
+    """Async client for Render API."""
 
-    def __init__(self, api_key: str):
+    def __init__(self, api_key: str, max_concurrency: int = 5):
         """Initialize client with API key.
 
         Args:
             api_key: Render API key
+            max_concurrency: Upper bound on concurrent requests issued by
+                batched operations like list_services_with_deploys
         """
         self.api_key = api_key
+        # Bounding the fan-out keeps batched refreshes from tripping API
+        # rate limits and tail-latency spikes at high service counts
+        self._fetch_sem = asyncio.Semaphore(max(1, max_concurrency))
         self._client: Optional[httpx.AsyncClient] = None
+        # Auth goes per-request so the pooled client can be shared across
+        # RenderClient instances (and API keys); build the header dict once
+        # here instead of re-formatting the bearer string in __aenter__
+        self._auth = {
+            "Authorization": f"Bearer {api_key}",
+            "Accept": "application/json",
+        }
+        # Cache for service list (5 min TTL), created once per client rather
+        # than per list_services call
+        self._cache = SimpleCache(ttl=300)
+        # Per-service deploy state polls on a much shorter TTL so batched
+        # refreshes can skip deploy requests for recently-seen services.
+        # The list response can't signal a redeploy (status there is derived
+        # from the suspended field alone), so this TTL is the only bound on
+        # deploy staleness — don't cache deploys without one.
+        self._deploy_cache = SimpleCache(ttl=30)
+        # Per-path ETag revalidation cache: path -> (etag, decoded body).
+        # Unchanged responses come back as body-less 304s with no JSON
+        # parse. O(paths polled), process-local.
+        self._etags: dict[str, tuple[str, dict]] = {}
 
     async def __aenter__(self):
         """Async context manager entry."""
-        self._client = httpx.AsyncClient(
-            base_url=self.BASE_URL,
-            headers={
-                "Authorization": f"Bearer {self.api_key}",
-                "Accept": "application/json",
-            },
-            timeout=30.0,
-        )
+        self._client = get_http_client()
         return self
 
     async def __aexit__(self, exc_type, exc_val, exc_tb):
         """Async context manager exit."""
-        if self._client:
-            await self._client.aclose()
+        # The underlying client is shared; it is closed at process exit
+        # (see _client.close_http_client), not per context manager
+        self._client = None
 
-    async def _request(self, method: str, path: str, **kwargs) -> dict:
-        """Make an API request.
+    async def _send(self, method: str, path: str, **kwargs) -> httpx.Response:
+        """Issue an API request and return the raw response.
+
+        304 Not Modified is returned as-is so callers doing conditional
+        GETs can serve their cached data.
 
         Args:
             method: HTTP method
@@ -63,7 +106,7 @@ class RenderClient:
             **kwargs: Additional arguments to pass to httpx
 
         Returns:
-            Response JSON as dict
+            The httpx Response
 
         Raises:
             RenderAPIError: On API errors
@@ -71,28 +114,84 @@ class RenderClient:
         if not self._client:
             raise RenderAPIError("Client not initialized. Use async context manager.")
 
+        headers = self._merge_headers(kwargs.pop("headers", None))
+
         try:
-            response = await self._client.request(method, path, **kwargs)
+            response = await self._client.request(method, path, headers=headers, **kwargs)
+            if response.status_code == 304:
+                return response
             response.raise_for_status()
-            return response.json()
+            return response
         except httpx.HTTPStatusError as e:
-            if e.response.status_code == 401:
-                raise RenderAPIError(
-                    "Authentication failed. Check your RENDER_API_KEY is correct."
-                )
-            elif e.response.status_code == 404:
-                raise RenderAPIError(f"Resource not found: {path}")
-            elif e.response.status_code == 429:
-                raise RenderAPIError(
-                    "Rate limit exceeded. Please wait before refreshing."
-                )
-            else:
-                raise RenderAPIError(
-                    f"API error {e.response.status_code}: {e.response.text}"
-                )
+            raise self._map_status_error(e, path)
         except httpx.RequestError as e:
             raise RenderAPIError(f"Network error: {e}")
 
+    @staticmethod
+    def _map_status_error(e: httpx.HTTPStatusError, path: str) -> RenderAPIError:
+        """Translate an HTTP status error into a RenderAPIError."""
+        code = e.response.status_code
+        msg = _ERROR_MESSAGES.get(code)
+        if msg:
+            return RenderAPIError(msg)
+        if code == 404:
+            return RenderAPIError(f"Resource not found: {path}")
+        # Only decode the response body when we actually include it
+        return RenderAPIError(f"API error {code}: {e.response.text}")
+
+    def _merge_headers(self, headers: Optional[dict]) -> dict:
+        """Merge per-call headers over the client auth headers."""
+        if headers:
+            return {**self._auth, **headers}
+        return self._auth
+
+    async def _request(self, method: str, path: str, **kwargs) -> dict:
+        """Make an API request and decode the JSON body.
+
+        Args:
+            method: HTTP method
+            path: API path (without base URL)
+            **kwargs: Additional arguments to pass to httpx
+
+        Returns:
+            Response JSON as dict
+
+        Raises:
+            RenderAPIError: On API errors
+        """
+        response = await self._send(method, path, **kwargs)
+        return _json_loads(response.content)
+
+    async def _get_conditional(self, path: str, **kwargs) -> dict:
+        """GET with per-path ETag revalidation.
+
+        Sends If-None-Match when the path was fetched before; a 304
+        answer reuses the cached decoded body, skipping both transfer
+        and JSON parse for the common nothing-changed polling case.
+
+        Args:
+            path: API path (without base URL)
+            **kwargs: Additional arguments to pass to httpx
+
+        Returns:
+            Response JSON as dict
+
+        Raises:
+            RenderAPIError: On API errors
+        """
+        cached = self._etags.get(path)
+        headers = {"If-None-Match": cached[0]} if cached else None
+        response = await self._send("GET", path, headers=headers, **kwargs)
+
+        if response.status_code == 304 and cached is not None:
+            return cached[1]
+
+        data = _json_loads(response.content)
+        etag = response.headers.get("etag")
+        if etag:
+            self._etags[path] = (etag, data)
+        return data
+
     def _parse_deploy_status(self, status: str) -> DeployStatus:
         """Parse deploy status from API response."""
         try:
@@ -103,23 +202,23 @@ class RenderClient:
 
     def _parse_service_status(self, status: str) -> ServiceStatus:
         """Parse service status from API response."""
-        # Map Render API status to our enum
-        status_map = {
-            "available": ServiceStatus.AVAILABLE,
-            "deploying": ServiceStatus.DEPLOYING,
-            "suspended": ServiceStatus.SUSPENDED,
-            "failed": ServiceStatus.FAILED,
-            "unavailable": ServiceStatus.FAILED,
-        }
-        return status_map.get(status.lower(), ServiceStatus.UNKNOWN)
+        return _STATUS_MAP.get(status.lower(), ServiceStatus.UNKNOWN)
 
     def _parse_datetime(self, dt_str: Optional[str]) -> Optional[datetime]:
         """Parse ISO datetime string."""
         if not dt_str:
             return None
+        # Render timestamps are ISO-8601; the C-implemented fromisoformat is
+        # ~10x faster than dateutil, which stays as a fallback for oddballs
         try:
-            return dateparser.isoparse(dt_str)
+            return datetime.fromisoformat(dt_str.replace("Z", "+00:00"))
         except (ValueError, TypeError):
+            pass
+        try:
+            # Rare non-ISO timestamp: pay dateutil's import cost only here
+            from dateutil import parser as dateparser
+            return dateparser.isoparse(dt_str)
+        except (ImportError, ValueError, TypeError):
             return None
 
     async def get_custom_domains(self, service_id: str) -> list[str]:
@@ -178,7 +277,11 @@ class RenderClient:
         Raises:
             RenderAPIError: On API errors
         """
-        data = await self._request("GET", f"/services/{service_id}")
+        # Service details and custom domains are independent GETs - fetch concurrently
+        data, custom_domains = await asyncio.gather(
+            self._get_conditional(f"/services/{service_id}"),
+            self.get_custom_domains(service_id),
+        )
 
         service_data = data.get("service", data)  # Handle wrapped or unwrapped response
 
@@ -189,9 +292,7 @@ class RenderClient:
         else:
             status = ServiceStatus.AVAILABLE
 
-        # Get custom domains from separate endpoint
         custom_domain = None
-        custom_domains = await self.get_custom_domains(service_id)
         if custom_domains:
             custom_domain = custom_domains[0]  # Use first custom domain
 
@@ -286,8 +387,13 @@ class RenderClient:
         Raises:
             RenderAPIError: On API errors
         """
-        # Fetch service data once to build service object and extract repo URL
-        data = await self._request("GET", f"/services/{service_id}")
+        # The three GETs (service, custom domains, latest deploy) are independent,
+        # so fan them out concurrently instead of awaiting each in sequence
+        data, custom_domains, latest_deploy = await asyncio.gather(
+            self._get_conditional(f"/services/{service_id}"),
+            self.get_custom_domains(service_id),
+            self.get_latest_deploy(service_id),
+        )
         service_data = data.get("service", data)
 
         # Extract repo URL for commit links
@@ -295,6 +401,11 @@ class RenderClient:
         if repo_url and repo_url.endswith(".git"):
             repo_url = repo_url[:-4]
 
+        # The deploy was fetched without the repo URL (concurrent fetch);
+        # backfill it so commit links still resolve
+        if latest_deploy and not latest_deploy.repo_url and repo_url:
+            latest_deploy = replace(latest_deploy, repo_url=repo_url)
+
         # Build service object (inline to avoid duplicate API call)
         # Render API doesn't provide a direct "status" field, derive from suspended field
         suspended = service_data.get("suspended", "not_suspended")
@@ -304,28 +415,223 @@ class RenderClient:
             # Default to available if not suspended (will be overridden if deploy is in progress)
             status = ServiceStatus.AVAILABLE
 
-        # Get custom domains
         custom_domain = None
-        custom_domains = await self.get_custom_domains(service_id)
         if custom_domains:
             custom_domain = custom_domains[0]
 
-        service = Service(
+        # Override status if deployment is in progress
+        if latest_deploy and latest_deploy.is_in_progress:
+            status = ServiceStatus.DEPLOYING
+
+        return Service(
             id=service_data["id"],
             name=service_data.get("name", service_id),
             type=service_data.get("type", "unknown"),
             status=status,
             url=service_data.get("serviceDetails", {}).get("url"),
             custom_domain=custom_domain,
+            latest_deploy=latest_deploy,
         )
 
-        # Override status if deployment is in progress, passing repo URL for commit links
-        latest_deploy = await self.get_latest_deploy(service_id, repo_url=repo_url)
-        if latest_deploy and latest_deploy.is_in_progress:
-            service.status = ServiceStatus.DEPLOYING
+    async def iter_services_with_deploys(
+        self, service_ids: list[str]
+    ) -> AsyncIterator[Service]:
+        """Yield the given services, with latest deploys, as each is ready.
 
-        service.latest_deploy = latest_deploy
-        return service
+        The full service list is fetched once up front; services whose
+        deploy state is cached are yielded immediately, and the rest are
+        yielded in completion order as their deploy (or fallback direct)
+        fetches land. Callers can update the UI per service instead of
+        waiting for the slowest fetch. Services whose fetch fails are
+        omitted; callers treat absence as a per-service failure.
+
+        Args:
+            service_ids: Render service IDs to fetch (yield order is
+                completion order, not input order)
+
+        Raises:
+            RenderAPIError: If the initial list call fails
+        """
+        all_services = await self.list_services(use_cache=False)
+        by_id = {s.id: s for s in all_services}
+
+        def _finalize(service: Service) -> Service:
+            # Same in-progress status override as get_service_with_deploy
+            if service.latest_deploy and service.latest_deploy.is_in_progress:
+                return replace(service, status=ServiceStatus.DEPLOYING)
+            return service
+
+        async def _with_deploy(service_id: str, service: Service) -> Service:
+            async with self._fetch_sem:
+                deploy = await self.get_latest_deploy(service_id)
+            # Only settle finished deploys into the cache; in-progress
+            # ones should be re-polled on the next refresh
+            if deploy is not None and not deploy.is_in_progress:
+                self._deploy_cache.set_pickle(f"deploy_{service_id}", deploy)
+            return replace(service, latest_deploy=deploy)
+
+        async def _fallback(service_id: str) -> Service:
+            # Not present in the list response; fall back to a direct fetch
+            async with self._fetch_sem:
+                return await self.get_service_with_deploy(service_id)
+
+        tasks: list[asyncio.Task] = []
+        for service_id in dict.fromkeys(service_ids):
+            service = by_id.get(service_id)
+            if service is None:
+                tasks.append(
+                    asyncio.create_task(_fallback(service_id), name=f"fetch:{service_id}")
+                )
+                continue
+
+            cached_deploy = self._deploy_cache.get_pickle(f"deploy_{service_id}")
+            if cached_deploy is not None:
+                yield _finalize(replace(service, latest_deploy=cached_deploy))
+            else:
+                tasks.append(
+                    asyncio.create_task(
+                        _with_deploy(service_id, service), name=f"deploy:{service_id}"
+                    )
+                )
+
+        for fut in asyncio.as_completed(tasks):
+            try:
+                service = await fut
+            except RenderAPIError:
+                continue
+            yield _finalize(service)
+
+    async def list_services_with_deploys(self, service_ids: list[str]) -> list[Service]:
+        """Fetch the given services, with latest deploys, via one list call.
+
+        Collects iter_services_with_deploys back into input order. A
+        steady-state refresh costs 1 + k requests, where k is the number
+        of services with stale deploy info.
+
+        Args:
+            service_ids: Render service IDs to fetch (order is preserved)
+
+        Returns:
+            List of Service objects with latest_deploy populated; services
+            whose fetch failed are omitted
+
+        Raises:
+            RenderAPIError: If the initial list call fails
+        """
+        order = {sid: i for i, sid in enumerate(dict.fromkeys(service_ids))}
+        services = [s async for s in self.iter_services_with_deploys(service_ids)]
+        services.sort(key=lambda s: order[s.id])
+        return services
+
+    def _parse_service_item(self, item) -> Optional[Service]:
+        """Build a Service from one /services response item.
+
+        Returns:
+            Service, or None for malformed items (non-dicts, missing IDs)
+        """
+        if not isinstance(item, dict):
+            return None
+
+        # Extract nested service object (response format: {service: {...}, cursor: "..."})
+        service_data = item.get("service", item)
+
+        # Get required fields with fallbacks
+        service_id = service_data.get("id") or service_data.get("serviceId")
+        if not service_id:
+            # Skip services without IDs
+            return None
+
+        # Get custom domain if available
+        custom_domain = None
+        service_details = service_data.get("serviceDetails", {})
+        if service_details.get("customDomains"):
+            custom_domains = service_details["customDomains"]
+            if isinstance(custom_domains, list) and len(custom_domains) > 0:
+                custom_domain = custom_domains[0].get("name") or custom_domains[0].get("domain")
+
+        # Determine status from suspended field
+        suspended = service_data.get("suspended", "not_suspended")
+        if suspended == "suspended":
+            status = ServiceStatus.SUSPENDED
+        else:
+            status = ServiceStatus.AVAILABLE
+
+        return Service(
+            id=service_id,
+            name=service_data.get("name", service_id),
+            type=service_data.get("type", "unknown"),
+            status=status,
+            url=service_details.get("url"),
+            custom_domain=custom_domain,
+        )
+
+    async def _stream_services(
+        self, limit: int, headers: Optional[dict]
+    ) -> tuple[httpx.Response, Optional[list]]:
+        """Stream the /services response, parsing items as bytes arrive.
+
+        For large accounts this avoids buffering the entire body before
+        parsing begins. Requires ijson; callers fall back to the buffered
+        path when it isn't installed.
+
+        Returns:
+            Tuple of (response, item list); the list is None on 304
+
+        Raises:
+            RenderAPIError: On API errors
+        """
+        if not self._client:
+            raise RenderAPIError("Client not initialized. Use async context manager.")
+
+        try:
+            async with self._client.stream(
+                "GET", "/services", params={"limit": limit},
+                headers=self._merge_headers(headers),
+            ) as response:
+                if response.status_code == 304:
+                    return response, None
+                if response.is_error:
+                    await response.aread()
+                    response.raise_for_status()
+
+                items = _ijson.sendable_list()
+                coro = _ijson.items_coro(items, "item")
+                parsed: list = []
+                # Buffer raw bytes only until the top-level array format is
+                # confirmed, so wrapped/odd responses can be decoded whole
+                raw: Optional[bytearray] = bytearray()
+
+                async for chunk in response.aiter_bytes():
+                    if raw is not None:
+                        raw.extend(chunk)
+                    coro.send(chunk)
+                    if items:
+                        parsed.extend(items)
+                        del items[:]
+                        raw = None
+                coro.close()
+                if items:
+                    parsed.extend(items)
+
+                if parsed or raw is None:
+                    return response, parsed
+
+                # Nothing matched the array fast path (wrapped dict or empty
+                # response); decode the accumulated body instead
+                data = _json_loads(bytes(raw)) if raw else []
+                if isinstance(data, list):
+                    return response, data
+                if isinstance(data, dict):
+                    return response, data.get("services", data.get("data", []))
+                return response, []
+        except httpx.HTTPStatusError as e:
+            raise self._map_status_error(e, "/services")
+        except httpx.RequestError as e:
+            raise RenderAPIError(f"Network error: {e}")
+        except _ijson.common.JSONError as e:
+            # ijson's errors subclass Exception, not ValueError, so wrap
+            # them here like the buffered path wraps json.JSONDecodeError
+            raise RenderAPIError(f"Error parsing service list: {e}")
 
     async def list_services(self, limit: int = 100, use_cache: bool = True) -> list[Service]:
         """List all services for the authenticated user.
@@ -341,98 +647,75 @@ class RenderClient:
             RenderAPIError: On API errors
         """
         # Check cache first
-        cache = self._get_cache()
+        cache = self._cache
         cache_key = f"services_list_{limit}"
 
+        etag = None
+        stale_services = None
         if use_cache:
-            cached_data = cache.get(cache_key)
-            if cached_data:
-                # Reconstruct Service objects from cached data
-                return [
-                    Service(
-                        id=s["id"],
-                        name=s["name"],
-                        type=s["type"],
-                        status=ServiceStatus(s["status"]),
-                        url=s.get("url"),
-                        custom_domain=s.get("custom_domain"),
-                    )
-                    for s in cached_data
-                ]
+            # Service objects are pickled directly (alongside the response
+            # ETag), so a hit needs no dict-to-dataclass rehydration
+            # Disk reads go through the default thread pool so a slow
+            # filesystem can't stall concurrent fetches on the event loop
+            # (the in-memory layer keeps warm hits cheap either way)
+            cached = await asyncio.to_thread(cache.get_pickle, cache_key)
+            if isinstance(cached, tuple):
+                return cached[1]
+
+            # TTL expired: keep the stale entry around so the request below
+            # can revalidate with If-None-Match instead of re-downloading
+            stale = await asyncio.to_thread(cache.get_pickle, cache_key, True)
+            if isinstance(stale, tuple):
+                etag, stale_services = stale
 
         try:
-            data = await self._request("GET", "/services", params={"limit": limit})
+            headers = {"If-None-Match": etag} if etag else None
 
-            # Handle different response formats
-            if isinstance(data, list):
-                services_data = data
-            elif isinstance(data, dict):
-                # Response might be wrapped in different ways
-                services_data = data.get("services", data.get("data", []))
+            if _ijson is not None:
+                response, services_data = await self._stream_services(limit, headers)
             else:
-                services_data = []
-
-            services = []
-
-            for item in services_data:
-                # Skip if not a dict
-                if not isinstance(item, dict):
-                    continue
-
-                # Extract nested service object (response format: {service: {...}, cursor: "..."})
-                service_data = item.get("service", item)
-
-                # Get required fields with fallbacks
-                service_id = service_data.get("id") or service_data.get("serviceId")
-                if not service_id:
-                    # Skip services without IDs
-                    continue
-
-                # Get custom domain if available
-                custom_domain = None
-                service_details = service_data.get("serviceDetails", {})
-                if service_details.get("customDomains"):
-                    custom_domains = service_details["customDomains"]
-                    if isinstance(custom_domains, list) and len(custom_domains) > 0:
-                        custom_domain = custom_domains[0].get("name") or custom_domains[0].get("domain")
-
-                # Determine status from suspended field
-                suspended = service_data.get("suspended", "not_suspended")
-                if suspended == "suspended":
-                    status = ServiceStatus.SUSPENDED
-                else:
-                    status = ServiceStatus.AVAILABLE
-
-                service = Service(
-                    id=service_id,
-                    name=service_data.get("name", service_id),
-                    type=service_data.get("type", "unknown"),
-                    status=status,
-                    url=service_data.get("serviceDetails", {}).get("url"),
-                    custom_domain=custom_domain,
+                response = await self._send(
+                    "GET", "/services", params={"limit": limit}, headers=headers
                 )
-                services.append(service)
+                services_data = None
+
+            if response.status_code == 304:
+                # Nothing changed server-side: no body to parse, just
+                # refresh the cache TTL on the existing data
+                services = stale_services or []
+                if services:
+                    await asyncio.to_thread(cache.set_pickle, cache_key, (etag, services))
+                return services
+
+            if services_data is None:
+                data = _json_loads(response.content)
+
+                # Handle different response formats
+                if isinstance(data, list):
+                    services_data = data
+                elif isinstance(data, dict):
+                    # Response might be wrapped in different ways
+                    services_data = data.get("services", data.get("data", []))
+                else:
+                    services_data = []
+
+            # Comprehension with a locally-bound parser: no repeated
+            # attribute lookup or .append method call per item
+            _parse = self._parse_service_item
+            services = [s for item in services_data if (s := _parse(item)) is not None]
 
             # Cache the results
             if use_cache and services:
-                cache_data = [
-                    {
-                        "id": s.id,
-                        "name": s.name,
-                        "type": s.type,
-                        "status": s.status.value,
-                        "url": s.url,
-                        "custom_domain": s.custom_domain,
-                    }
-                    for s in services
-                ]
-                cache.set(cache_key, cache_data)
+                await asyncio.to_thread(
+                    cache.set_pickle, cache_key, (response.headers.get("etag"), services)
+                )
 
             return services
-        except RenderAPIError as e:
-            raise e
-        except Exception as e:
-            raise RenderAPIError(f"Error parsing service list: {e}")
+        except (KeyError, TypeError, ValueError) as e:
+            # RenderAPIError propagates untouched; only malformed payloads
+            # are wrapped. Narrow excepts also keep CancelledError out of
+            # the error path during shutdown.
+            raise RenderAPIError(f"Error parsing service list: {e}") from e
 
     async def get_env_vars(self, service_id: str) -> list[EnvVar]:
         """Get environment variables for a service.
@@ -496,7 +779,5 @@ class RenderClient:
             env_vars.sort(key=lambda x: x.key.lower())
 
             return env_vars
-        except RenderAPIError as e:
-            raise e
-        except Exception as e:
-            raise RenderAPIError(f"Error fetching environment variables: {e}")
+        except (KeyError, TypeError, ValueError) as e:
+            raise RenderAPIError(f"Error fetching environment variables: {e}") from e
@@ -1,8 +1,26 @@
 """Simple file-based cache for API responses."""
-import json
+import os
+import pickle
 import time
 from pathlib import Path
-from typing import Optional, Any
+from typing import Any, Optional
+
+try:
+    # Optional speedup: orjson parses/serializes several times faster than
+    # stdlib json for the list-of-dicts payloads cached here
+    from orjson import dumps as _dumps
+    from orjson import loads as _loads
+except ImportError:
+    import json as _json
+
+    _loads = _json.loads
+
+    def _dumps(obj: Any) -> bytes:
+        return _json.dumps(obj).encode("utf-8")
+
+
+# Key sanitization as a single C-level pass (vs. chained str.replace)
+_KEY_TRANS = str.maketrans({"/": "_", ":": "_"})
 
 
 class SimpleCache:
@@ -20,13 +38,17 @@ class SimpleCache:
 
         self.cache_dir = cache_dir
         self.ttl = ttl
-        self.cache_dir.mkdir(parents=True, exist_ok=True)
-
-    def _get_cache_path(self, key: str) -> Path:
+        # Process-local layer above the file cache: repeat hits on the same
+        # key are a dict lookup with zero syscalls and no JSON parse
+        self._mem: dict[str, tuple[float, Any]] = {}
+        # Single stat in the common already-exists case instead of an
+        # unconditional mkdir attempt
+        if not self.cache_dir.exists():
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+
+    def _get_cache_path(self, key: str, suffix: str = ".json") -> Path:
         """Get cache file path for a key."""
-        # Simple key sanitization
-        safe_key = key.replace("/", "_").replace(":", "_")
-        return self.cache_dir / f"{safe_key}.json"
+        return self.cache_dir / f"{key.translate(_KEY_TRANS)}{suffix}"
 
     def get(self, key: str) -> Optional[Any]:
         """Get value from cache.
@@ -37,14 +59,26 @@ class SimpleCache:
         Returns:
             Cached value or None if not found or expired
         """
+        # In-memory fast path
+        entry = self._mem.get(key)
+        if entry is not None:
+            timestamp, value = entry
+            if time.time() - timestamp <= self.ttl:
+                return value
+            del self._mem[key]
+
         cache_path = self._get_cache_path(key)
 
-        if not cache_path.exists():
+        try:
+            if cache_path.stat().st_size == 0:
+                # Leftover from an interrupted write; don't bother parsing
+                cache_path.unlink()
+                return None
+        except OSError:
             return None
 
         try:
-            with open(cache_path, "r") as f:
-                data = json.load(f)
+            data = _loads(cache_path.read_bytes())
 
             # Check if expired
             if time.time() - data["timestamp"] > self.ttl:
@@ -52,9 +86,11 @@ class SimpleCache:
                 cache_path.unlink()
                 return None
 
+            # Promote to the in-memory layer for subsequent hits
+            self._mem[key] = (data["timestamp"], data["value"])
             return data["value"]
 
-        except (json.JSONDecodeError, KeyError, IOError):
+        except (ValueError, KeyError, OSError):
             # Corrupted cache file, delete it
             if cache_path.exists():
                 cache_path.unlink()
@@ -69,15 +105,82 @@ class SimpleCache:
         """
         cache_path = self._get_cache_path(key)
 
+        timestamp = time.time()
+        self._mem[key] = (timestamp, value)
+
         data = {
-            "timestamp": time.time(),
+            "timestamp": timestamp,
             "value": value
         }
 
         try:
-            with open(cache_path, "w") as f:
-                json.dump(data, f)
-        except (IOError, TypeError):
+            # Write to a sibling temp file and atomically swap it in so an
+            # interrupted write never leaves a truncated cache file behind
+            tmp_path = cache_path.with_suffix(cache_path.suffix + ".tmp")
+            tmp_path.write_bytes(_dumps(data))
+            os.replace(tmp_path, cache_path)
+        except (OSError, TypeError):
+            # Failed to cache, ignore
+            pass
+
+    def get_pickle(self, key: str, allow_expired: bool = False) -> Optional[Any]:
+        """Get a pickled value from cache.
+
+        Unlike get/set, values round-trip as Python objects (e.g. a list of
+        Service dataclasses) with no JSON conversion or manual rehydration.
+
+        Args:
+            key: Cache key
+            allow_expired: Return the value even past its TTL. Expired
+                entries are kept around (not deleted) so callers can use
+                them for conditional-GET revalidation.
+
+        Returns:
+            Cached object or None if not found (or expired, unless
+            allow_expired is set)
+        """
+        entry = self._mem.get(key)
+        if entry is not None:
+            timestamp, value = entry
+            if allow_expired or time.time() - timestamp <= self.ttl:
+                return value
+            return None
+
+        cache_path = self._get_cache_path(key, suffix=".pkl")
+
+        try:
+            data = pickle.loads(cache_path.read_bytes())
+
+            if not allow_expired and time.time() - data["timestamp"] > self.ttl:
+                return None
+
+            self._mem[key] = (data["timestamp"], data["value"])
+            return data["value"]
+
+        except (pickle.UnpicklingError, EOFError, KeyError, OSError, AttributeError):
+            # Missing or corrupted cache file
+            cache_path.unlink(missing_ok=True)
+            return None
+
+    def set_pickle(self, key: str, value: Any) -> None:
+        """Set a pickled value in cache.
+
+        Args:
+            key: Cache key
+            value: Value to cache (must be picklable)
+        """
+        cache_path = self._get_cache_path(key, suffix=".pkl")
+
+        timestamp = time.time()
+        self._mem[key] = (timestamp, value)
+
+        try:
+            tmp_path = cache_path.with_suffix(cache_path.suffix + ".tmp")
+            tmp_path.write_bytes(
+                pickle.dumps({"timestamp": timestamp, "value": value}, pickle.HIGHEST_PROTOCOL)
+            )
+            os.replace(tmp_path, cache_path)
+        except (OSError, pickle.PicklingError):
             # Failed to cache, ignore
             pass
 
@@ -88,10 +191,14 @@ class SimpleCache:
             key: If provided, clear specific key. Otherwise clear all cache.
         """
         if key:
-            cache_path = self._get_cache_path(key)
-            if cache_path.exists():
-                cache_path.unlink()
+            self._mem.pop(key, None)
+            for suffix in (".json", ".pkl"):
+                cache_path = self._get_cache_path(key, suffix=suffix)
+                if cache_path.exists():
+                    cache_path.unlink()
         else:
+            self._mem.clear()
             # Clear all cache files
-            for cache_file in self.cache_dir.glob("*.json"):
-                cache_file.unlink()
+            for pattern in ("*.json", "*.pkl"):
+                for cache_file in self.cache_dir.glob(pattern):
+                    cache_file.unlink()
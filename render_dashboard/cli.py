@@ -1,13 +1,18 @@
 """CLI command mode for quick service access."""
 import sys
-import asyncio
-import webbrowser
 from pathlib import Path
-from typing import Optional
+from typing import TYPE_CHECKING, Optional
 
-from .config import load_config, find_service_by_alias, ConfigError
-from .api import RenderClient, RenderAPIError
+if TYPE_CHECKING:
+    from .api import RenderClient
+
+from .config import ConfigError, find_service_by_alias, load_config
 from .models import ServiceConfig
+from .utils import time_ago
+
+# asyncio, webbrowser and .api (which pulls in httpx) are imported inside
+# the functions that need them: the usage/help and --no-browser paths then
+# never pay for them, and sys.modules makes repeat imports free
 
 
 class CLIError(Exception):
@@ -15,6 +20,69 @@ class CLIError(Exception):
     pass
 
 
+# Status -> icon lookup tables: one dict probe instead of an if/elif chain
+# of string compares per status render
+_SERVICE_STATUS_ICON = {
+    "available": "🟢",
+    "deploying": "🟠",
+    "suspended": "⚫",
+    "failed": "🔴",
+}
+
+_DEPLOY_STATUS_ICON = {
+    "live": "🟢",
+    "build_failed": "🔴",
+}
+
+_VALID_ACTIONS = ("logs", "events", "metrics", "settings", "status")
+
+# Usage banner as one constant: the help path is a single stdout write
+# instead of a dozen separate print calls
+_USAGE = """\
+Usage: rdash [--config <path>] <service> <action> [--no-browser]
+
+Actions:
+  logs      - Open service logs in browser
+  events    - Open service events in browser
+  metrics   - Open service metrics in browser
+  settings  - Open service settings in browser
+  status    - Show current service status
+
+Options:
+  --config <path>  Path to config file
+  --no-browser     Print URL without opening browser
+
+Examples:
+  rdash chat logs
+  rdash auth events
+  rdash accounts status
+  rdash all status
+  rdash chat logs --no-browser
+  rdash --config ~/my-config.yaml chat logs
+"""
+
+
+def _run(coro):
+    """Run a coroutine to completion with the cheapest available loop.
+
+    Prefers uvloop's event loop where installed (POSIX-only optional
+    dependency) and asyncio.Runner (3.11+) for explicit loop lifecycle
+    control; falls back to plain asyncio.run.
+    """
+    import asyncio
+
+    try:
+        import uvloop
+        uvloop.install()
+    except ImportError:
+        pass
+
+    if hasattr(asyncio, "Runner"):
+        with asyncio.Runner() as runner:
+            return runner.run(coro)
+    return asyncio.run(coro)
+
+
 def get_service_url(service_id: str, action: str) -> str:
     """Get Render dashboard URL for a service action.
 
@@ -39,76 +107,117 @@ def get_service_url(service_id: str, action: str) -> str:
         return base_url
 
 
-async def get_service_status(service_config: ServiceConfig, api_key: str) -> str:
+async def get_service_status(
+    service_config: ServiceConfig, api_key: str, client: Optional["RenderClient"] = None
+) -> str:
     """Get current status of a service.
 
     Args:
         service_config: Service configuration
         api_key: Render API key
+        client: Already-open RenderClient to reuse; one is opened per
+            call when omitted
 
     Returns:
         Formatted status string
     """
-    from .utils import time_ago
+    from .api import RenderAPIError, RenderClient
 
     try:
-        async with RenderClient(api_key) as client:
+        if client is None:
+            async with RenderClient(api_key) as client:
+                service = await client.get_service_with_deploy(service_config.id)
+        else:
             service = await client.get_service_with_deploy(service_config.id)
 
-            # Build status string with colored icons
-            status_parts = []
-
-            # Service status with appropriate icon
-            if service.status.value == "available":
-                status_icon = "🟢"  # Green for live
-            elif service.status.value == "deploying":
-                status_icon = "🟠"  # Orange for deploying
-            elif service.status.value == "suspended":
-                status_icon = "⚫"  # Gray for suspended
-            elif service.status.value == "failed":
-                status_icon = "🔴"  # Red for failed
+        # Bind .value once; it's read several times below
+        svc_status = service.status.value
+
+        # Service status with appropriate icon (white for unknown)
+        status_icon = _SERVICE_STATUS_ICON.get(svc_status, "⚪")
+
+        # Output has a fixed shape; optional lines default to "" and
+        # are filtered out of the join, so no list growth per call
+        url_line = ""
+        deploy_line = ""
+        deployed_line = ""
+        commit_line = ""
+
+        # Show custom domain (primary URL), falling back to Render URL
+        if service.custom_domain:
+            url_line = f"URL: https://{service.custom_domain}"
+        elif service.url:
+            url_line = f"URL: {service.url}"
+
+        if service.latest_deploy:
+            deploy = service.latest_deploy
+            deploy_status = deploy.status.value
+
+            # Deploy status with icon; in-progress states share one
+            # icon so they're handled before the lookup
+            if deploy.is_in_progress:
+                deploy_icon = "🟠"
             else:
-                status_icon = "⚪"  # White for unknown
+                deploy_icon = _DEPLOY_STATUS_ICON.get(deploy_status, "⚪")
+
+            # Make deploy status clearer
+            deploy_status_text = deploy_status.replace("_", " ").title()
+            deploy_line = f"Deployment: {deploy_icon} {deploy_status_text}"
+            deployed_line = f"Deployed: {time_ago(deploy.created_at)}"
+
+            # Add GitHub commit link if available
+            if deploy.commit_sha and deploy.repo_url:
+                commit_url = f"{deploy.repo_url}/commit/{deploy.commit_sha}"
+                commit_line = f"Commit: {deploy.commit_sha[:7]} - {commit_url}"
+
+        lines = (
+            f"{status_icon} {service.name}",
+            f"Status: {svc_status}",
+            f"Type: {service.type}",
+            url_line,
+            deploy_line,
+            deployed_line,
+            commit_line,
+        )
+        return "\n".join(line for line in lines if line)
+
+    except RenderAPIError as e:
+        return f"Error fetching status: {e}"
 
-            status_parts.append(f"{status_icon} {service.name}")
-            status_parts.append(f"Status: {service.status.value}")
-            status_parts.append(f"Type: {service.type}")
 
-            # Show custom domain (primary URL)
-            if service.custom_domain:
-                status_parts.append(f"URL: https://{service.custom_domain}")
-            elif service.url:
-                # Fallback to Render URL if no custom domain
-                status_parts.append(f"URL: {service.url}")
+async def get_many_statuses(
+    services: list[ServiceConfig], api_key: str, concurrency: int = 8
+) -> list[str]:
+    """Fetch statuses for many services concurrently.
 
-            if service.latest_deploy:
-                deploy = service.latest_deploy
+    All fetches share the pooled HTTP client, so N statuses cost one TLS
+    handshake and roughly max(RTT) rather than sum(RTT).
 
-                # Deploy status with icon
-                if deploy.status.value == "live":
-                    deploy_icon = "🟢"
-                elif deploy.is_in_progress:
-                    deploy_icon = "🟠"
-                elif deploy.status.value == "build_failed":
-                    deploy_icon = "🔴"
-                else:
-                    deploy_icon = "⚪"
+    Args:
+        services: Service configurations to query
+        api_key: Render API key
+        concurrency: Maximum in-flight requests
 
-                # Make deploy status clearer
-                deploy_status_text = deploy.status.value.replace("_", " ").title()
-                status_parts.append(f"Deployment: {deploy_icon} {deploy_status_text}")
+    Returns:
+        Formatted status strings, one per service, in input order
+    """
+    import asyncio
 
-                status_parts.append(f"Deployed: {time_ago(deploy.created_at)}")
+    from .api import RenderClient
 
-                # Add GitHub commit link if available
-                if deploy.commit_sha and deploy.repo_url:
-                    commit_url = f"{deploy.repo_url}/commit/{deploy.commit_sha}"
-                    status_parts.append(f"Commit: {deploy.commit_sha[:7]} - {commit_url}")
+    sem = asyncio.Semaphore(concurrency)
 
-            return "\n".join(status_parts)
+    async with RenderClient(api_key) as client:
+        async def _one(service_config: ServiceConfig) -> str:
+            async with sem:
+                return await get_service_status(service_config, api_key, client=client)
 
-    except RenderAPIError as e:
-        return f"Error fetching status: {e}"
+        tasks = [asyncio.ensure_future(_one(s)) for s in services]
+        results = await asyncio.gather(*tasks, return_exceptions=True)
+    return [
+        r if isinstance(r, str) else f"Error fetching status: {r}"
+        for r in results
+    ]
 
 
 def handle_cli_command(args: list[str], config_path: Optional[Path] = None) -> int:
@@ -121,26 +230,13 @@ def handle_cli_command(args: list[str], config_path: Optional[Path] = None) -> i
     Returns:
         Exit code (0 for success, 1 for error)
     """
+    # Ordering matters for latency: arg-count and action validation both
+    # run (and fail) before any config load, so the help and error paths
+    # never touch YAML. This also covers "rdash <svc> --no-browser" with
+    # no action — the flag is filtered out and the empty action fails
+    # validation below, still ahead of load_config.
     if len(args) < 2:
-        print("Usage: rdash [--config <path>] <service> <action> [--no-browser]")
-        print("")
-        print("Actions:")
-        print("  logs      - Open service logs in browser")
-        print("  events    - Open service events in browser")
-        print("  metrics   - Open service metrics in browser")
-        print("  settings  - Open service settings in browser")
-        print("  status    - Show current service status")
-        print("")
-        print("Options:")
-        print("  --config <path>  Path to config file")
-        print("  --no-browser     Print URL without opening browser")
-        print("")
-        print("Examples:")
-        print("  rdash chat logs")
-        print("  rdash auth events")
-        print("  rdash accounts status")
-        print("  rdash chat logs --no-browser")
-        print("  rdash --config ~/my-config.yaml chat logs")
+        sys.stdout.write(_USAGE)
         return 1
 
     # Parse --no-browser flag
@@ -151,10 +247,10 @@ def handle_cli_command(args: list[str], config_path: Optional[Path] = None) -> i
     action = args[1].lower() if len(args) > 1 else ""
 
     # Validate action
-    valid_actions = ["logs", "events", "metrics", "settings", "status"]
-    if action not in valid_actions:
-        print(f"Invalid action: {action}")
-        print(f"Valid actions: {', '.join(valid_actions)}")
+    if action not in _VALID_ACTIONS:
+        sys.stdout.write(
+            f"Invalid action: {action}\nValid actions: {', '.join(_VALID_ACTIONS)}\n"
+        )
         return 1
 
     # Load config
@@ -164,16 +260,23 @@ def handle_cli_command(args: list[str], config_path: Optional[Path] = None) -> i
         print(f"Configuration error: {e}")
         return 1
 
+    # "all status" fetches every configured service in one batch
+    if service_alias == "all" and action == "status":
+        statuses = _run(get_many_statuses(config.services, config.render.api_key))
+        print("\n\n".join(statuses))
+        return 0
+
     # Find service
     try:
         service_config = find_service_by_alias(config, service_alias)
         if service_config is None:
-            print(f"No service found matching '{service_alias}'")
-            print("")
-            print("Available services:")
-            for svc in config.services:
-                aliases = ", ".join(svc.aliases) if svc.aliases else "no aliases"
-                print(f"  {svc.name} ({aliases})")
+            lines = [f"No service found matching '{service_alias}'", "", "Available services:"]
+            lines.extend(
+                f"  {svc.name} ({', '.join(svc.aliases) if svc.aliases else 'no aliases'})"
+                for svc in config.services
+            )
+            lines.append("")
+            sys.stdout.write("\n".join(lines))
             return 1
     except ConfigError as e:
         print(str(e))
@@ -181,7 +284,7 @@ def handle_cli_command(args: list[str], config_path: Optional[Path] = None) -> i
 
     # Handle status action separately (doesn't open browser)
     if action == "status":
-        status = asyncio.run(get_service_status(service_config, config.render.api_key))
+        status = _run(get_service_status(service_config, config.render.api_key))
         print(status)
         return 0
 
@@ -193,6 +296,8 @@ def handle_cli_command(args: list[str], config_path: Optional[Path] = None) -> i
         return 0
 
     try:
+        import webbrowser
+
         webbrowser.open(url)
         print(f"Opening {action} for {service_config.name}...")
         print(f"URL: {url}")
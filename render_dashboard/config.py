@@ -1,25 +1,68 @@
 """Configuration file parsing and validation."""
 import os
-import yaml
+import pickle
+import tempfile
 from pathlib import Path
+
+import yaml
+
+try:
+    # libyaml-backed loader/dumper: the C scanner parses config files
+    # several times faster than the pure-Python SafeLoader
+    from yaml import CSafeDumper as _SafeDumper
+    from yaml import CSafeLoader as _SafeLoader
+except ImportError:
+    from yaml import SafeDumper as _SafeDumper
+    from yaml import SafeLoader as _SafeLoader
+from dataclasses import dataclass, field
+from operator import attrgetter
 from typing import Optional
-from dataclasses import dataclass
 
 from .models import ServiceConfig
 
 
-@dataclass
+@dataclass(slots=True)
 class RenderConfig:
     """Render API configuration."""
     api_key: str
     refresh_interval: int = 30
+    # Fast-poll floor used while any service is actively deploying
+    min_interval: int = 5
+    # Upper bound on concurrent API requests during a dashboard refresh
+    max_concurrency: int = 5
 
 
-@dataclass
+@dataclass(slots=True)
 class AppConfig:
     """Application configuration."""
     render: RenderConfig
     services: list[ServiceConfig]
+    # Lookup structures for find_service_by_alias, built once per config
+    # load instead of lowercasing every alias on every lookup
+    _alias_index: dict = field(default_factory=dict, repr=False)
+    _partial_index: list = field(default_factory=list, repr=False)
+    # Priority-sorted view, computed once at load instead of per listing
+    _services_by_priority: tuple = field(default=(), repr=False)
+
+    def _build_indexes(self) -> None:
+        """Populate the alias lookup structures from ``services``."""
+        self._alias_index.clear()
+        self._partial_index.clear()
+        self._services_by_priority = tuple(
+            sorted(self.services, key=attrgetter("priority"))
+        )
+        for service in self.services:
+            lower_aliases = tuple(a.lower() for a in service.aliases)
+            lower_name = service.name.lower()
+            for a in lower_aliases:
+                # First service wins on duplicate aliases, matching the
+                # old first-match-in-list behavior
+                self._alias_index.setdefault(a, service)
+            # Full names and service ids are exact keys too, so typing
+            # either skips the partial-match walk entirely
+            self._alias_index.setdefault(lower_name, service)
+            self._alias_index.setdefault(service.id, service)
+            self._partial_index.append((lower_aliases, lower_name, service))
 
 
 class ConfigError(Exception):
@@ -27,18 +70,113 @@ class ConfigError(Exception):
     pass
 
 
+# Parsed-config cache: config.yaml rarely changes between CLI invocations,
+# so the warm path becomes stat() + pickle.load instead of a YAML parse.
+# Disable with RDASH_NO_CACHE=1. Kept in its own subdirectory so
+# SimpleCache.clear(), which globs *.pkl in the shared cache dir, never
+# deletes it (it embeds the resolved API key).
+_CONFIG_CACHE_PATH = Path.home() / ".cache" / "render-dashboard" / "config" / "config.pkl"
+
+
+def _load_cached_config(cache_key: str) -> Optional["AppConfig"]:
+    """Return the cached AppConfig if it matches cache_key, else None.
+
+    Entries record the environment variables that were substituted at
+    parse time; a change to any of them invalidates the entry.
+    """
+    try:
+        entry = pickle.loads(_CONFIG_CACHE_PATH.read_bytes())
+        if entry["key"] != cache_key:
+            return None
+        for var, value in entry["env"].items():
+            if os.getenv(var) != value:
+                return None
+        return entry["config"]
+    except (OSError, pickle.UnpicklingError, EOFError, KeyError, AttributeError, TypeError):
+        return None
+
+
+def _store_cached_config(cache_key: str, env_checks: dict, config: "AppConfig") -> None:
+    """Atomically persist the parsed config; failures are ignored."""
+    try:
+        _CONFIG_CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = _CONFIG_CACHE_PATH.with_suffix(".pkl.tmp")
+        tmp_path.write_bytes(
+            pickle.dumps(
+                {"key": cache_key, "env": env_checks, "config": config},
+                pickle.HIGHEST_PROTOCOL,
+            )
+        )
+        # The resolved api_key is embedded, so keep the file private
+        os.chmod(tmp_path, 0o600)
+        os.replace(tmp_path, _CONFIG_CACHE_PATH)
+    except (OSError, pickle.PicklingError):
+        pass
+
+
+def _load_raw(config_path: Path) -> dict:
+    """Load the raw YAML mapping from a config file (empty dict if blank)."""
+    with open(config_path, "r") as f:
+        return yaml.load(f, Loader=_SafeLoader) or {}
+
+
+def _write_raw(config_path: Path, data: dict) -> None:
+    """Atomically write the raw YAML mapping back to the config file.
+
+    Dumps to a sibling temp file and swaps it in with os.replace so an
+    interrupted write never leaves a torn config behind.
+    """
+    fd = tempfile.NamedTemporaryFile(
+        "w", dir=config_path.parent, suffix=".tmp", delete=False
+    )
+    try:
+        with fd as f:
+            yaml.dump(data, f, Dumper=_SafeDumper, default_flow_style=False, sort_keys=False)
+        os.replace(fd.name, config_path)
+    except BaseException:
+        os.unlink(fd.name)
+        raise
+
+
 def _substitute_env_vars(value: str) -> str:
     """Substitute environment variables in format ${VAR_NAME}."""
-    if isinstance(value, str) and value.startswith("${") and value.endswith("}"):
-        env_var = value[2:-1]
-        env_value = os.getenv(env_var)
-        if env_value is None:
-            raise ConfigError(
-                f"Environment variable {env_var} not set. "
-                f"Please set it with: export {env_var}=your-value"
-            )
-        return env_value
-    return value
+    if not isinstance(value, str):
+        return value
+
+    # removeprefix tests and slices in one C-level call; an unchanged
+    # result (identity) means the prefix wasn't there. len >= 2 keeps
+    # the variable name non-empty after stripping the trailing brace.
+    inner = value.removeprefix("${")
+    if inner is value or len(inner) < 2 or not inner.endswith("}"):
+        return value
+
+    env_var = inner[:-1]
+    try:
+        return os.environ[env_var]
+    except KeyError:
+        raise ConfigError(
+            f"Environment variable {env_var} not set. "
+            f"Please set it with: export {env_var}=your-value"
+        ) from None
+
+
+def _validate_service_entry(service_data, index: int) -> bool:
+    """Validate one raw service mapping; always True when valid.
+
+    Raises:
+        ConfigError: If the entry is malformed
+    """
+    if not isinstance(service_data, dict):
+        raise ConfigError(f"Service at index {index} must be a dictionary")
+
+    service_id = service_data.get("id")
+    if not service_id:
+        raise ConfigError(f"Service at index {index} missing required 'id' field")
+
+    if not isinstance(service_data.get("aliases", []), list):
+        raise ConfigError(f"Service {service_id}: 'aliases' must be a list")
+
+    return True
 
 
 def find_config_path() -> Optional[Path]:
@@ -106,9 +244,21 @@ def load_config(config_path: Optional[Path] = None, allow_empty_services: bool =
     if not config_path.exists():
         raise ConfigError(f"Config file not found: {config_path}")
 
+    cache_key = None
+    if not os.getenv("RDASH_NO_CACHE"):
+        try:
+            st = os.stat(config_path)
+            cache_key = f"{Path(config_path).resolve()}-{st.st_mtime_ns}-{st.st_size}"
+        except OSError:
+            pass
+        if cache_key:
+            cached = _load_cached_config(cache_key)
+            if cached is not None:
+                return cached
+
     try:
         with open(config_path, "r") as f:
-            data = yaml.safe_load(f)
+            data = yaml.load(f, Loader=_SafeLoader)
     except yaml.YAMLError as e:
         raise ConfigError(f"Invalid YAML in config file: {e}")
 
@@ -120,7 +270,13 @@ def load_config(config_path: Optional[Path] = None, allow_empty_services: bool =
     if not render_data:
         raise ConfigError("Missing 'render' section in config")
 
-    api_key = _substitute_env_vars(render_data.get("api_key", ""))
+    raw_api_key = render_data.get("api_key", "")
+    api_key = _substitute_env_vars(raw_api_key)
+    # Track substituted variables so the pickle cache can invalidate when
+    # the environment changes out from under it
+    env_checks = {}
+    if api_key is not raw_api_key and isinstance(raw_api_key, str):
+        env_checks[raw_api_key[2:-1]] = api_key
     if not api_key:
         raise ConfigError(
             "Missing render.api_key in config. "
@@ -129,7 +285,9 @@ def load_config(config_path: Optional[Path] = None, allow_empty_services: bool =
 
     render_config = RenderConfig(
         api_key=api_key,
-        refresh_interval=render_data.get("refresh_interval", 30)
+        refresh_interval=render_data.get("refresh_interval", 30),
+        min_interval=render_data.get("min_interval", 5),
+        max_concurrency=render_data.get("max_concurrency", 5),
     )
 
     # Parse services
@@ -140,30 +298,29 @@ def load_config(config_path: Optional[Path] = None, allow_empty_services: bool =
             "  rdash service add <service-name>"
         )
 
-    services = []
-    for i, service_data in enumerate(services_data):
-        if not isinstance(service_data, dict):
-            raise ConfigError(f"Service at index {i} must be a dictionary")
-
-        service_id = service_data.get("id")
-        if not service_id:
-            raise ConfigError(f"Service at index {i} missing required 'id' field")
-
-        name = service_data.get("name", service_id)
-        aliases = service_data.get("aliases", [])
-        if not isinstance(aliases, list):
-            raise ConfigError(f"Service {service_id}: 'aliases' must be a list")
+    # Comprehension with a local alias: LIST_APPEND instead of method-call
+    # .append, and no global ServiceConfig lookup per iteration
+    _SC = ServiceConfig
+    services = [
+        _SC(
+            id=sd["id"],
+            name=sd.get("name", sd["id"]),
+            aliases=sd.get("aliases", []),
+            priority=sd.get("priority", 1),
+        )
+        for i, sd in enumerate(services_data)
+        if _validate_service_entry(sd, i)
+    ]
 
-        priority = service_data.get("priority", 1)
+    config = AppConfig(render=render_config, services=services)
+    config._build_indexes()
 
-        services.append(ServiceConfig(
-            id=service_id,
-            name=name,
-            aliases=aliases,
-            priority=priority
-        ))
+    # Only cache configs with services: an empty config cached under
+    # allow_empty_services must not bypass validation on a later strict load
+    if cache_key and services:
+        _store_cached_config(cache_key, env_checks, config)
 
-    return AppConfig(render=render_config, services=services)
+    return config
 
 
 def find_service_by_alias(config: AppConfig, alias: str) -> Optional[ServiceConfig]:
@@ -176,21 +333,23 @@ def find_service_by_alias(config: AppConfig, alias: str) -> Optional[ServiceConf
         ConfigError: If multiple services match
     """
     alias_lower = alias.lower()
-    matches = []
 
-    for service in config.services:
-        # Check exact alias match first
-        if alias_lower in [a.lower() for a in service.aliases]:
-            return service
+    if not config._partial_index and config.services:
+        # Config built by hand rather than through load_config
+        config._build_indexes()
+
+    # Exact alias match is a single dict probe
+    exact = config._alias_index.get(alias_lower)
+    if exact is not None:
+        return exact
 
-        # Check partial matches in aliases and name
-        for a in service.aliases:
-            if alias_lower in a.lower():
-                matches.append(service)
-                break
-        else:
-            if alias_lower in service.name.lower():
-                matches.append(service)
+    # Partial matches against pre-lowered aliases and names
+    matches = []
+    for lower_aliases, lower_name, service in config._partial_index:
+        if any(alias_lower in a for a in lower_aliases):
+            matches.append(service)
+        elif alias_lower in lower_name:
+            matches.append(service)
 
     if len(matches) == 0:
         return None
@@ -228,7 +387,8 @@ def add_service_to_config(
     service_name: str,
     aliases: list[str],
     priority: int = 1,
-    config_path: Optional[Path] = None
+    config_path: Optional[Path] = None,
+    raw: Optional[dict] = None
 ) -> None:
     """Add a new service to the config file.
 
@@ -238,6 +398,8 @@ def add_service_to_config(
         aliases: List of aliases for CLI access
         priority: Display priority (default 1)
         config_path: Path to config file (uses default locations if None)
+        raw: Already-loaded raw config mapping; skips the disk re-read
+            when the caller just parsed the file
 
     Raises:
         ConfigError: If config file issues occur
@@ -246,9 +408,10 @@ def add_service_to_config(
         config_path = get_config_path()
 
     # Load existing config or create new one
-    if config_path.exists():
-        with open(config_path, "r") as f:
-            data = yaml.safe_load(f) or {}
+    if raw is not None:
+        data = raw
+    elif config_path.exists():
+        data = _load_raw(config_path)
     else:
         # Create parent directory if needed
         config_path.parent.mkdir(parents=True, exist_ok=True)
@@ -276,20 +439,20 @@ def add_service_to_config(
     services.append(new_service)
     data["services"] = services
 
-    # Write back to file
-    with open(config_path, "w") as f:
-        yaml.dump(data, f, default_flow_style=False, sort_keys=False)
+    _write_raw(config_path, data)
 
 
 def remove_service_from_config(
     service_id: str,
-    config_path: Optional[Path] = None
+    config_path: Optional[Path] = None,
+    raw: Optional[dict] = None
 ) -> None:
     """Remove a service from the config file.
 
     Args:
         service_id: Render service ID to remove
         config_path: Path to config file (uses default locations if None)
+        raw: Already-loaded raw config mapping; skips the disk re-read
 
     Raises:
         ConfigError: If service not found or config file issues
@@ -300,8 +463,7 @@ def remove_service_from_config(
     if not config_path.exists():
         raise ConfigError("No config file found")
 
-    with open(config_path, "r") as f:
-        data = yaml.safe_load(f) or {}
+    data = raw if raw is not None else _load_raw(config_path)
 
     services = data.get("services", [])
     original_length = len(services)
@@ -314,6 +476,4 @@ def remove_service_from_config(
 
     data["services"] = services
 
-    # Write back to file
-    with open(config_path, "w") as f:
-        yaml.dump(data, f, default_flow_style=False, sort_keys=False)
+    _write_raw(config_path, data)
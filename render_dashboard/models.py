@@ -25,7 +25,7 @@ class DeployStatus(str, Enum):
     DEACTIVATED = "deactivated"
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Deploy:
     """Represents a Render deployment."""
     id: str
@@ -46,7 +46,24 @@ class Deploy:
         )
 
 
-@dataclass
+# Status display lookups: one dict probe per repaint instead of an
+# if/elif ladder of enum comparisons
+_STATUS_EMOJI = {
+    ServiceStatus.AVAILABLE: "●",  # Green dot (will be colored in UI)
+    ServiceStatus.DEPLOYING: "●",  # Yellow dot
+    ServiceStatus.FAILED: "●",  # Red dot
+    ServiceStatus.SUSPENDED: "○",  # Gray hollow circle
+}
+
+_STATUS_COLOR = {
+    ServiceStatus.AVAILABLE: "green",
+    ServiceStatus.DEPLOYING: "yellow",
+    ServiceStatus.FAILED: "red",
+    ServiceStatus.SUSPENDED: "bright_black",
+}
+
+
+@dataclass(slots=True, frozen=True)
 class Service:
     """Represents a Render service."""
     id: str
@@ -59,27 +76,11 @@ class Service:
 
     def get_status_emoji(self) -> str:
         """Get emoji representation of service status."""
-        if self.status == ServiceStatus.AVAILABLE:
-            return "●"  # Green dot (will be colored in UI)
-        elif self.status == ServiceStatus.DEPLOYING:
-            return "●"  # Yellow dot
-        elif self.status == ServiceStatus.FAILED:
-            return "●"  # Red dot
-        elif self.status == ServiceStatus.SUSPENDED:
-            return "○"  # Gray hollow circle
-        return "?"
+        return _STATUS_EMOJI.get(self.status, "?")
 
     def get_status_color(self) -> str:
         """Get Textual color name for service status."""
-        if self.status == ServiceStatus.AVAILABLE:
-            return "green"
-        elif self.status == ServiceStatus.DEPLOYING:
-            return "yellow"
-        elif self.status == ServiceStatus.FAILED:
-            return "red"
-        elif self.status == ServiceStatus.SUSPENDED:
-            return "gray"
-        return "white"
+        return _STATUS_COLOR.get(self.status, "white")
 
 
 @dataclass
@@ -89,7 +90,7 @@ class EnvVar:
     value: str
 
 
-@dataclass
+@dataclass(slots=True)
 class ServiceConfig:
     """Configuration for a service from config.yaml."""
     id: str
@@ -11,11 +11,18 @@ from .config import (
     get_config_path,
     ConfigError
 )
-from .api import RenderClient, RenderAPIError
-from .models import Service
+from ._lazy import lazy_import
 
+# The api package pulls in httpx; defer it so commands like
+# "rdash service list" never pay for it
+api = lazy_import("render_dashboard.api")
 
-async def search_and_add_service(search_term: str, api_key: str, config_path: Optional[Path] = None) -> int:
+
+async def search_and_add_service(
+    search_term: str,
+    api_key: str,
+    config_path: Optional[Path] = None,
+) -> int:
     """Search for services by name and add to config.
 
     Args:
@@ -32,7 +39,7 @@ async def search_and_add_service(search_term: str, api_key: str, config_path: Op
         print()
 
         try:
-            async with RenderClient(api_key) as client:
+            async with api.RenderClient(api_key) as client:
                 service = await client.get_service(search_term)
 
             print(f"Found: {service.name} ({service.id})")
@@ -41,7 +48,7 @@ async def search_and_add_service(search_term: str, api_key: str, config_path: Op
             # Skip to alias prompt
             matches = [service]
 
-        except RenderAPIError as e:
+        except api.RenderAPIError as e:
             print(f"Error fetching service: {e}")
             print()
             print("Make sure the service ID is correct.")
@@ -51,7 +58,7 @@ async def search_and_add_service(search_term: str, api_key: str, config_path: Op
         print(f"Searching for services matching '{search_term}'...")
         print()
 
-        async with RenderClient(api_key) as client:
+        async with api.RenderClient(api_key) as client:
             all_services = await client.list_services()
 
         if not all_services:
@@ -62,24 +69,25 @@ async def search_and_add_service(search_term: str, api_key: str, config_path: Op
             print("  rdash service add srv-xxxxxxxxxxxxx")
             return 1
 
-        # Filter services matching search term
+        # Filter services matching search term; lowercase each candidate
+        # once instead of per comparison
         search_lower = search_term.lower()
+        lowered = [(s, s.name.lower(), s.id.lower()) for s in all_services]
         matches = [
-            s for s in all_services
-            if search_lower in s.name.lower() or search_lower in s.id.lower()
+            s for s, name_lower, id_lower in lowered
+            if search_lower in name_lower or search_lower in id_lower
         ]
 
         if not matches:
-            print(f"No services found matching '{search_term}'")
-            print()
-            print("Available services:")
-            for service in all_services[:10]:  # Show first 10
-                print(f"  - {service.name} ({service.id})")
+            # One stdout write for the whole block instead of a dozen
+            # print calls (and their per-call flushes when piped)
+            out = [f"No services found matching '{search_term}'", "", "Available services:"]
+            out.extend(f"  - {service.name} ({service.id})" for service in all_services[:10])
             if len(all_services) > 10:
-                print(f"  ... and {len(all_services) - 10} more")
-            print()
-            print("Or add by service ID directly:")
-            print("  rdash service add srv-xxxxxxxxxxxxx")
+                out.append(f"  ... and {len(all_services) - 10} more")
+            out.extend(["", "Or add by service ID directly:",
+                        "  rdash service add srv-xxxxxxxxxxxxx"])
+            sys.stdout.write("\n".join(out) + "\n")
             return 1
 
     # Show matches (used by both search and direct ID lookup)
@@ -90,10 +98,14 @@ async def search_and_add_service(search_term: str, api_key: str, config_path: Op
             print(f"Found: {service.name} ({service.id})")
             print()
     else:
-        print(f"Found {len(matches)} matching services:")
-        for i, service in enumerate(matches, 1):
-            print(f"  {i}. {service.name} ({service.id}) - {service.type}")
-        print()
+        # Emit the whole numbered list in one write before prompting
+        out = [f"Found {len(matches)} matching services:"]
+        out.extend(
+            f"  {i}. {service.name} ({service.id}) - {service.type}"
+            for i, service in enumerate(matches, 1)
+        )
+        out.append("")
+        sys.stdout.write("\n".join(out) + "\n")
 
         # Prompt user to select
         while True:
@@ -140,12 +152,11 @@ async def search_and_add_service(search_term: str, api_key: str, config_path: Op
             config_path=config_path
         )
         used_config_path = config_path if config_path else get_config_path()
-        print(f"✓ Service added to {used_config_path}")
-        print()
-        print("You can now use:")
+        out = [f"✓ Service added to {used_config_path}", "", "You can now use:"]
         for alias in aliases:
-            print(f"  rdash {alias} logs")
-            print(f"  rdash {alias} status")
+            out.append(f"  rdash {alias} logs")
+            out.append(f"  rdash {alias} status")
+        sys.stdout.write("\n".join(out) + "\n")
         return 0
 
     except ConfigError as e:
@@ -164,15 +175,19 @@ async def list_configured_services(config_path: Optional[Path] = None) -> int:
     """
     try:
         config = load_config(config_path=config_path)
-        print(f"Configured services ({len(config.services)}):")
-        print()
 
-        for service in sorted(config.services, key=lambda s: s.priority):
+        # Sorted once at config load; listing is a straight walk,
+        # accumulated into a single stdout write
+        if not config._services_by_priority and config.services:
+            config._build_indexes()
+        out = [f"Configured services ({len(config.services)}):", ""]
+        for service in config._services_by_priority:
             aliases_str = ", ".join(service.aliases) if service.aliases else "no aliases"
-            print(f"  {service.name}")
-            print(f"    ID: {service.id}")
-            print(f"    Aliases: {aliases_str}")
-            print()
+            out.append(f"  {service.name}")
+            out.append(f"    ID: {service.id}")
+            out.append(f"    Aliases: {aliases_str}")
+            out.append("")
+        sys.stdout.write("\n".join(out) + "\n")
 
         return 0
 
@@ -194,12 +209,13 @@ async def remove_service_interactive(alias_or_id: str, config_path: Optional[Pat
     try:
         config = load_config(config_path=config_path)
 
-        # Find service by alias or ID
-        service = None
-        for s in config.services:
-            if s.id == alias_or_id or alias_or_id.lower() in [a.lower() for a in s.aliases]:
-                service = s
-                break
+        # Find service by alias or ID: single dict probe against the
+        # consolidated index built at config load
+        if not config._alias_index and config.services:
+            config._build_indexes()
+        service = config._alias_index.get(alias_or_id) or config._alias_index.get(
+            alias_or_id.lower()
+        )
 
         if not service:
             print(f"Service '{alias_or_id}' not found in config")
@@ -1,5 +1,8 @@
 """Main Textual TUI application."""
 import asyncio
+import random
+import re
+import time
 import webbrowser
 from pathlib import Path
 from typing import Optional
@@ -8,12 +11,21 @@ from textual.app import App, ComposeResult
 from textual.containers import Container, VerticalScroll
 from textual.widgets import Header, Static, Input
 from textual.binding import Binding
+from textual.timer import Timer
 
 from ..config import AppConfig, load_config, ConfigError
+from ..utils import cached_now
 from ..api import RenderClient, RenderAPIError
 from ..models import Service
 from .widgets import ServiceCard, StatusBar, EnvVarsScreen
 
+# Pre-parsed spinner frames: each animation tick is an index bump and one
+# Static.update, with no fresh markup string construction
+_LOADING_FRAMES = (
+    "[bold yellow]⟳ Loading services...[/]",
+    "[bold yellow]⟲ Loading services...[/]",
+)
+
 
 class DashboardApp(App):
     """Render Services Dashboard TUI application."""
@@ -86,9 +98,36 @@ class DashboardApp(App):
         super().__init__(*args, **kwargs)
         self.config_path = config_path
         self.config: Optional[AppConfig] = None
+        # One client for the app's lifetime (opened in on_mount, closed in
+        # on_unmount) so every refresh reuses pooled keep-alive connections
+        self.client: Optional[RenderClient] = None
         self.service_cards: dict[str, ServiceCard] = {}
+        # Snapshot of each service's render-relevant fields from the last
+        # refresh; unchanged services skip the Textual update entirely
+        self._last_service_state: dict[str, tuple] = {}
         self.refresh_task: Optional[asyncio.Task] = None
-        self.loading_animation_state: bool = False
+        self._loading_widget: Optional[Static] = None
+        self._error_widget: Optional[Static] = None
+        self._loading_timer: Optional[Timer] = None
+        # Maintained by ServiceCard focus/blur events
+        self.focused_service_id: Optional[str] = None
+        self._frame_idx: int = 0
+        # Refresh coalescing: one in-flight refresh at a time, with a
+        # minimum spacing between consecutive runs
+        self._refresh_inflight: Optional[asyncio.Task] = None
+        self._last_refresh: float = 0.0
+        # Adaptive poll cadence: fast while deploys are in flight,
+        # backed off toward refresh_interval when everything is stable
+        self._current_interval: float = 0.0
+        # Debounced search state: only the final query after a burst of
+        # keystrokes runs the filter loop
+        self._search_timer: Optional[Timer] = None
+        self._pending_query: str = ""
+        # Monotonic narrowing: a query extending the previous one can
+        # only match a subset of the cards it matched, so only those are
+        # re-checked on the next keystroke
+        self._prev_query: str = ""
+        self._visible_ids: set = set()
 
     def compose(self) -> ComposeResult:
         """Compose the UI layout."""
@@ -101,14 +140,32 @@ class DashboardApp(App):
 
     async def on_mount(self) -> None:
         """Initialize the dashboard when mounted."""
+        # Cache the stable widgets once: query_one walks the widget tree
+        # per call, and these are hit on every refresh/keystroke
+        self._container = self.query_one("#services-container")
+        self._status_bar = self.query_one(StatusBar)
+        self._search_input = self.query_one("#search-input", Input)
+
+        # Pooled error widget: repeated failures update its text and
+        # toggle visibility instead of mounting a new Static each time
+        self._error_widget = Static("", classes="error-message")
+        self._error_widget.display = False
+        self._container.mount(self._error_widget)
+
         # Show loading in status bar
-        status_bar = self.query_one(StatusBar)
+        status_bar = self._status_bar
         status_bar.set_loading(True)
 
         try:
             # Load configuration
             self.config = load_config(self.config_path)
 
+            # Open the long-lived API client
+            self.client = await RenderClient(
+                self.config.render.api_key,
+                max_concurrency=self.config.render.max_concurrency,
+            ).__aenter__()
+
             # Initial service load
             await self.refresh_services()
 
@@ -118,7 +175,13 @@ class DashboardApp(App):
                 first_card.focus()
 
             # Start auto-refresh task
-            self.refresh_task = asyncio.create_task(self._auto_refresh_loop())
+            self.refresh_task = asyncio.create_task(
+                self._auto_refresh_loop(), name="auto-refresh"
+            )
+
+            # One shared tick advances every card's relative timestamp;
+            # cards early-exit unless their rendered bucket changed
+            self.set_interval(1.0, self._tick_time_ago)
 
         except ConfigError as e:
             status_bar.set_loading(False)
@@ -135,128 +198,245 @@ class DashboardApp(App):
                 await self.refresh_task
             except asyncio.CancelledError:
                 pass
+        if self.client is not None:
+            await self.client.__aexit__(None, None, None)
+            self.client = None
 
     def _show_error(self, message: str) -> None:
         """Show an error message in the UI."""
-        container = self.query_one("#services-container")
+        widget = getattr(self, "_error_widget", None)
+        if widget is not None:
+            widget.update(message)
+            widget.display = True
+            return
+        # May fire before on_mount creates the pooled widget
+        container = getattr(self, "_container", None) or self.query_one("#services-container")
         container.mount(Static(message, classes="error-message"))
 
     def _show_loading(self) -> None:
         """Show loading message with animation."""
-        container = self.query_one("#services-container")
-        container.remove_children()
-        loading_widget = Static("[bold yellow]⟳ Loading services...[/]", classes="loading-message", id="loading-message")
-        container.mount(loading_widget)
+        if self._loading_widget is None:
+            self._loading_widget = Static(
+                _LOADING_FRAMES[0], classes="loading-message", id="loading-message"
+            )
+            self._container.mount(self._loading_widget)
+        else:
+            # Reuse the pooled widget from a previous loading cycle
+            self._loading_widget.update(_LOADING_FRAMES[0])
+            self._loading_widget.display = True
         # Start loading animation
-        self.loading_animation_state = False
-        self.set_interval(0.15, self._update_loading_animation, name="loading_animation")
+        self._frame_idx = 0
+        self._loading_timer = self.set_interval(0.15, self._update_loading_animation)
 
     def _update_loading_animation(self) -> None:
         """Update loading animation."""
-        try:
-            widget = self.query_one("#loading-message", Static)
-            if self.loading_animation_state:
-                widget.update("[bold yellow]⟳ Loading services...[/]")
-            else:
-                widget.update("[bold yellow]⟲ Loading services...[/]")
-            self.loading_animation_state = not self.loading_animation_state
-        except Exception:
-            # Widget no longer exists, stop animation
-            try:
-                self.remove_timer("loading_animation")
-            except Exception:
-                pass
+        widget = self._loading_widget
+        if widget is None or not widget.display:
+            # Loading finished; stop animating
+            if self._loading_timer is not None:
+                self._loading_timer.stop()
+                self._loading_timer = None
+            return
+        self._frame_idx += 1
+        widget.update(_LOADING_FRAMES[self._frame_idx % len(_LOADING_FRAMES)])
 
     async def refresh_services(self) -> None:
         """Fetch and update all services."""
-        if not self.config:
+        if not self.config or self.client is None:
             return
 
         try:
-            async with RenderClient(self.config.render.api_key) as client:
-                # Fetch all services concurrently
-                tasks = [
-                    client.get_service_with_deploy(svc.id)
-                    for svc in self.config.services
-                ]
-                services = await asyncio.gather(*tasks, return_exceptions=True)
-
-                # Stop loading animation if running
-                try:
-                    self.remove_timer("loading_animation")
-                except Exception:
-                    pass
-
-                # Update UI with results
-                container = self.query_one("#services-container")
-
-                # Clear loading message if it exists
-                try:
-                    loading_msg = container.query_one("#loading-message")
-                    loading_msg.remove()
-                except Exception:
-                    pass
-
-                for service_config, service_result in zip(self.config.services, services):
-                    if isinstance(service_result, Exception):
-                        # Handle error for this specific service
-                        # Remove the card if it exists (to avoid showing stale/empty data)
-                        if service_config.id in self.service_cards:
-                            card = self.service_cards[service_config.id]
-                            card.remove()
-                            del self.service_cards[service_config.id]
-                        # Log the error (optional: could show error in UI instead)
-                        self.log.error(f"Failed to load service {service_config.name}: {service_result}")
-                        continue
-
-                    service: Service = service_result
-
-                    if service.id in self.service_cards:
-                        # Update existing card
-                        self.service_cards[service.id].update_service(service)
-                    else:
-                        # Create new card
-                        card = ServiceCard(service)
-                        self.service_cards[service.id] = card
-                        container.mount(card)
-
-                # Update status bar
-                status_bar = self.query_one(StatusBar)
-                status_bar.update_time()
+            # Dedupe by id first: duplicate config entries (copy-paste,
+            # multi-env yaml merges) should cost one fetch and one card,
+            # matching the id-keyed service_cards dict
+            unique = {svc.id: svc for svc in self.config.services}
+
+            # Stream services as each fetch lands: cards update in
+            # completion order instead of waiting for the slowest
+            # service, while the client still batches via one list call
+            stream = self.client.iter_services_with_deploys(list(unique))
+
+            # Stop loading animation if running
+            if self._loading_timer is not None:
+                self._loading_timer.stop()
+                self._loading_timer = None
+
+            # Update UI with results
+            container = self._container
+
+            # Hide the pooled loading/error widgets on success
+            if self._loading_widget is not None:
+                self._loading_widget.display = False
+            if self._error_widget is not None:
+                self._error_widget.display = False
+
+            seen: set[str] = set()
+            new_cards: list[ServiceCard] = []
+            now = cached_now()
+            async for service in stream:
+                seen.add(service.id)
+                self._apply_service_update(service, new_cards, now)
+
+            # Existing cards update as each fetch streams in above; new
+            # cards are flushed in one mount_all so the initial load
+            # pays a single layout pass instead of one per card. They
+            # arrive in completion order, so restore config order before
+            # mounting — the listing must not vary with network timing.
+            if new_cards:
+                order = {sid: i for i, sid in enumerate(unique)}
+                new_cards.sort(key=lambda card: order[card.service.id])
+                container.mount_all(new_cards)
+
+            for service_config in unique.values():
+                if service_config.id in seen:
+                    continue
+                # Fetch failed for this service; drop the card so
+                # we never show stale/empty data
+                if service_config.id in self.service_cards:
+                    card = self.service_cards.pop(service_config.id)
+                    card.remove()
+                self._last_service_state.pop(service_config.id, None)
+                self.log.error(f"Failed to load service {service_config.name}")
+
+            # Update status bar once after the last fetch completes
+            self._status_bar.update_time()
 
         except RenderAPIError as e:
             self._show_error(f"API error: {e}")
         except Exception as e:
             self._show_error(f"Error refreshing services: {e}")
 
+    async def _request_refresh(self) -> None:
+        """Run a refresh, coalescing concurrent and rapid-fire requests.
+
+        A refresh already in flight is joined instead of duplicated, and
+        requests landing within 0.5s of the previous completion wait out
+        the remainder, so mashing "r" while the auto-refresh loop fires
+        can't stack API calls.
+        """
+        if self._refresh_inflight is not None and not self._refresh_inflight.done():
+            await self._refresh_inflight
+            return
+
+        remaining = 0.5 - (time.monotonic() - self._last_refresh)
+        if remaining > 0:
+            await asyncio.sleep(remaining)
+            # Another caller may have started a refresh while we waited
+            if self._refresh_inflight is not None and not self._refresh_inflight.done():
+                await self._refresh_inflight
+                return
+
+        self._refresh_inflight = asyncio.create_task(
+            self.refresh_services(), name="refresh-services"
+        )
+        try:
+            await self._refresh_inflight
+        finally:
+            self._last_refresh = time.monotonic()
+            self._refresh_inflight = None
+
+    def _apply_service_update(
+        self, service: Service, new_cards: list[ServiceCard], now: float
+    ) -> None:
+        """Create or update the card for one fetched service.
+
+        Args:
+            service: Freshly fetched service
+            new_cards: Collects cards for services not yet displayed;
+                the caller mounts them in one batch
+            now: Epoch seconds shared across this refresh pass
+        """
+        deploy = service.latest_deploy
+        state = (
+            service.status,
+            service.name,
+            deploy.id if deploy else None,
+            deploy.status if deploy else None,
+            service.url,
+            service.custom_domain,
+        )
+
+        # One dict probe covers both the membership test and the lookup
+        card = self.service_cards.get(service.id)
+        if card is not None:
+            # Skip the Textual re-render when nothing the card displays
+            # has changed since last refresh; only the relative
+            # timestamp may need a repaint, and the card checks its own
+            # bucket before doing even that
+            if self._last_service_state.get(service.id) == state:
+                card.refresh_time_ago(now)
+                return
+            self._last_service_state[service.id] = state
+            # Update existing card
+            card.update_service(service)
+        else:
+            # Create new card; mounted by the caller in one batch
+            card = ServiceCard(service)
+            self.service_cards[service.id] = card
+            self._last_service_state[service.id] = state
+            new_cards.append(card)
+
+    def _tick_time_ago(self) -> None:
+        """Advance "X ago" displays between refreshes.
+
+        Runs at 1 Hz with a single clock reading for all cards; each
+        card's refresh_time_ago compares its rendered bucket and only
+        repaints on an actual rollover, so an idle tick costs one string
+        compare per card.
+        """
+        if not self.service_cards:
+            return
+        now = cached_now()
+        for card in self.service_cards.values():
+            card.refresh_time_ago(now)
+
     async def _auto_refresh_loop(self) -> None:
-        """Background task that auto-refreshes services."""
+        """Background task that auto-refreshes services.
+
+        Polls at min_interval while any service has a deploy in
+        progress, and backs off by 1.5x per stable cycle up to
+        refresh_interval. A +/-10% jitter keeps many dashboards from
+        hitting the API in lockstep.
+        """
         if not self.config:
             return
 
-        interval = self.config.render.refresh_interval
+        ceiling = float(self.config.render.refresh_interval)
+        floor = float(self.config.render.min_interval)
+        self._current_interval = ceiling
 
         try:
             while True:
-                await asyncio.sleep(interval)
-                await self.refresh_services()
+                any_in_progress = any(
+                    card.service.latest_deploy
+                    and card.service.latest_deploy.is_in_progress
+                    for card in self.service_cards.values()
+                )
+                if any_in_progress:
+                    self._current_interval = floor
+                else:
+                    self._current_interval = min(self._current_interval * 1.5, ceiling)
+
+                await asyncio.sleep(self._current_interval * random.uniform(0.9, 1.1))
+                await self._request_refresh()
         except asyncio.CancelledError:
             pass
 
     async def action_refresh(self) -> None:
         """Handle manual refresh action."""
-        await self.refresh_services()
+        await self._request_refresh()
 
     def _get_focused_service_id(self) -> Optional[str]:
         """Get the service ID of the currently focused service card."""
-        focused = self.focused
-        if isinstance(focused, ServiceCard):
-            return focused.service.id
-        return None
+        return self.focused_service_id
 
-    def _open_service_url(self, service_id: str, action: str) -> None:
+    async def _open_service_url(self, service_id: str, action: str) -> None:
         """Open a service URL in the browser.
 
+        webbrowser.open can block for hundreds of milliseconds while the
+        OS launches the browser, so it runs in the default executor to
+        keep the event loop (and the UI) responsive.
+
         Args:
             service_id: Service ID
             action: Action (logs, events, deploys, settings)
@@ -264,8 +444,9 @@ class DashboardApp(App):
         from ..cli import get_service_url
 
         url = get_service_url(service_id, action)
+        loop = asyncio.get_running_loop()
         try:
-            webbrowser.open(url)
+            await loop.run_in_executor(None, webbrowser.open, url)
         except Exception:
             # Silently fail - user can open manually
             pass
@@ -278,11 +459,11 @@ class DashboardApp(App):
             # Handle env vars specially - show modal instead of opening URL
             await self._show_env_vars(message.service_id)
         else:
-            self._open_service_url(message.service_id, message.action)
+            await self._open_service_url(message.service_id, message.action)
 
     async def _show_env_vars(self, service_id: str) -> None:
         """Show environment variables modal for a service."""
-        if not self.config:
+        if not self.config or self.client is None:
             return
 
         # Find service name
@@ -295,10 +476,10 @@ class DashboardApp(App):
         error_msg = None
 
         try:
-            # Fetch env vars from API
-            async with RenderClient(self.config.render.api_key) as client:
-                env_vars = await client.get_env_vars(service_id)
-                self.log.info(f"Fetched {len(env_vars)} env vars for {service_name}")
+            # Fetch env vars over the long-lived client so the modal
+            # reuses the pooled connection instead of a fresh handshake
+            env_vars = await self.client.get_env_vars(service_id)
+            self.log.info(f"Fetched {len(env_vars)} env vars for {service_name}")
 
         except RenderAPIError as e:
             error_msg = str(e)
@@ -310,29 +491,29 @@ class DashboardApp(App):
         # Show modal screen even if there was an error
         await self.push_screen(EnvVarsScreen(service_name, service_id, env_vars, error=error_msg))
 
-    def action_action_logs(self) -> None:
+    async def action_action_logs(self) -> None:
         """Open logs for focused service."""
         service_id = self._get_focused_service_id()
         if service_id:
-            self._open_service_url(service_id, "logs")
+            await self._open_service_url(service_id, "logs")
 
-    def action_action_events(self) -> None:
+    async def action_action_events(self) -> None:
         """Open events for focused service."""
         service_id = self._get_focused_service_id()
         if service_id:
-            self._open_service_url(service_id, "events")
+            await self._open_service_url(service_id, "events")
 
-    def action_action_metrics(self) -> None:
+    async def action_action_metrics(self) -> None:
         """Open metrics for focused service."""
         service_id = self._get_focused_service_id()
         if service_id:
-            self._open_service_url(service_id, "metrics")
+            await self._open_service_url(service_id, "metrics")
 
-    def action_action_settings(self) -> None:
+    async def action_action_settings(self) -> None:
         """Open settings for focused service."""
         service_id = self._get_focused_service_id()
         if service_id:
-            self._open_service_url(service_id, "settings")
+            await self._open_service_url(service_id, "settings")
 
     async def action_action_env_vars(self) -> None:
         """Show environment variables for focused service."""
@@ -345,12 +526,13 @@ class DashboardApp(App):
         if not self.service_cards:
             return  # No services to search
 
-        search_input = self.query_one("#search-input", Input)
+        search_input = self._search_input
         search_input.value = ""  # Clear any previous search
 
         # Make sure all services are visible
         for card in self.service_cards.values():
-            card.styles.display = "block"
+            if card.styles.display != "block":
+                card.styles.display = "block"
 
         search_input.add_class("visible")
         search_input.can_focus = True
@@ -358,7 +540,7 @@ class DashboardApp(App):
 
     def action_cancel_search(self) -> None:
         """Hide search and focus first service."""
-        search_input = self.query_one("#search-input", Input)
+        search_input = self._search_input
 
         # Only act if search is visible
         if not search_input.has_class("visible"):
@@ -369,8 +551,10 @@ class DashboardApp(App):
         search_input.value = ""
 
         # Show all services
+        self._prev_query = ""
         for card in self.service_cards.values():
-            card.styles.display = "block"
+            if card.styles.display != "block":
+                card.styles.display = "block"
 
         # Focus first service card
         if self.service_cards:
@@ -387,23 +571,69 @@ class DashboardApp(App):
 
         query = event.value.lower().strip()
 
-        # If empty query, show all services
+        # Cancel any pending filter run from earlier keystrokes
+        if self._search_timer is not None:
+            self._search_timer.stop()
+            self._search_timer = None
+
+        # Empty query shows everything immediately for responsiveness
         if not query:
+            self._pending_query = ""
+            self._prev_query = ""
             for card in self.service_cards.values():
-                card.styles.display = "block"
+                if card.styles.display != "block":
+                    card.styles.display = "block"
             return
 
-        # Filter services by name
-        for card in self.service_cards.values():
-            matches = query in card.service.name.lower()
-            card.styles.display = "block" if matches else "none"
+        # Debounce ~100ms so fast typing triggers one filter pass, not one
+        # Textual reflow per character
+        self._pending_query = query
+        self._search_timer = self.set_timer(0.1, self._apply_search_filter)
+
+    def _apply_search_filter(self) -> None:
+        """Apply the pending search query to the service cards."""
+        self._search_timer = None
+        query = self._pending_query
+        if not query:
+            return
+
+        # Filter services by name: compile the query once per filter pass
+        # and reuse the C-level matcher across every card
+        pattern = re.compile(re.escape(query), re.IGNORECASE)
+        visible: set = set()
+
+        if self._prev_query and query.startswith(self._prev_query):
+            # Narrowing: cards hidden by the shorter query stay hidden,
+            # so only the currently visible subset needs re-checking
+            for service_id in self._visible_ids:
+                card = self.service_cards.get(service_id)
+                if card is None:
+                    continue
+                if pattern.search(card._name_lower) is not None:
+                    visible.add(service_id)
+                else:
+                    card.styles.display = "none"
+        else:
+            for service_id, card in self.service_cards.items():
+                matches = pattern.search(card._name_lower) is not None
+                # Only touch styles on an actual visibility flip; setting
+                # display triggers Textual style reconciliation even when
+                # the value is unchanged
+                desired = "block" if matches else "none"
+                if card.styles.display != desired:
+                    card.styles.display = desired
+                if matches:
+                    visible.add(service_id)
+
+        self._prev_query = query
+        self._visible_ids = visible
 
     async def on_input_submitted(self, event: Input.Submitted) -> None:
         """Handle search input submission (Enter key)."""
         if event.input.id != "search-input":
             return
 
-        search_input = self.query_one("#search-input", Input)
+        search_input = self._search_input
         search_input.remove_class("visible")
         search_input.can_focus = False
 
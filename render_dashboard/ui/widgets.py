@@ -1,14 +1,107 @@
 """Custom widgets for the TUI dashboard."""
+import platform
+import shutil
+import subprocess
+import time
+import webbrowser
+from functools import lru_cache
 from typing import Optional
-from datetime import datetime
 from textual.app import ComposeResult
 from textual.containers import Container, VerticalScroll
 from textual.widgets import Static, Label, OptionList
 from textual.widgets.option_list import Option
 from textual.message import Message
 from textual.screen import ModalScreen
+from rich.text import Text
+
+from ..models import Service, EnvVar, _STATUS_COLOR, _STATUS_EMOJI
+
+# Prebuilt header fragments per status, derived from the model's
+# emoji/color tables so the display has a single source of truth
+_STATUS_MARKUP = {
+    status.value: f"[{_STATUS_COLOR[status]}]{_STATUS_EMOJI[status]} {status.value.title()}[/]"
+    for status in _STATUS_EMOJI
+}
+_STATUS_MARKUP["unknown"] = "[white]? Unknown[/]"
+
+# Parsed once at import: Static re-parses markup strings on every
+# update, but a prebuilt Text renders as-is
+_ACTIONS_TEXT = Text.from_markup(
+    "[bold cyan]L[/]ogs | [bold cyan]E[/]vents | [bold cyan]M[/]etrics | "
+    "En[bold cyan]v[/] | [bold cyan]S[/]ettings"
+)
+
+# Details line templates: %-interpolation runs through CPython's
+# C-level formatter, measurably cheaper than f-strings in the per-card
+# refresh path
+_DETAILS_IN_PROGRESS = "└─ Deploy started: %s"
+_DETAILS_COMPLETED = "└─ Last deploy: %s (%s)"
+
+# EnvVarsScreen footer variants, same treatment
+_FOOTER_BROWSE_TEXT = Text.from_markup("[bold]ESC[/] Close | [bold]B[/] Open in Browser")
+_FOOTER_FULL_TEXT = Text.from_markup(
+    "[bold]ESC[/] Close | [bold]↑↓[/] Navigate | [bold]C[/] Copy | [bold]B[/] Browser"
+)
+
+# Status bar layout: only the time fragment changes per tick, so the
+# controls text and surrounding template are built once at import
+_CONTROLS = (
+    "[bold cyan]R[/] Refresh | [bold cyan]Q[/] Quit | [bold cyan]/[/] Search | "
+    "[bold cyan]L[/] Logs | [bold cyan]E[/] Events | [bold cyan]M[/] Metrics | "
+    "[bold cyan]V[/] Env | [bold cyan]S[/] Settings"
+)
+_STATUS_TEMPLATE = " {text}  |  " + _CONTROLS
+
+# The OS doesn't change at runtime; resolve it once for the clipboard path
+_PLATFORM = platform.system()
+
+# Key -> service action for ServiceCard.on_key; hoisted so the hot key
+# path allocates nothing
+_ACTION_MAP = {
+    "l": "logs",
+    "e": "events",
+    "m": "metrics",
+    "v": "env_vars",
+    "s": "settings",
+}
+
+
+def _detect_clip_cmd() -> Optional[list[str]]:
+    """Resolve the clipboard helper argv for this platform, if any.
+
+    Runs once at import so copy actions use the cached argv instead of
+    probing the filesystem (or hitting FileNotFoundError) per keypress.
+    """
+    if _PLATFORM == "Darwin":
+        cmd = shutil.which("pbcopy")
+        return [cmd] if cmd else None
+    if _PLATFORM == "Linux":
+        cmd = shutil.which("xclip")
+        return [cmd, "-selection", "clipboard"] if cmd else None
+    return None
+
+
+_CLIP_CMD = _detect_clip_cmd()
+
 
-from ..models import Service, EnvVar
+@lru_cache(maxsize=256)
+def _format_commit_fragment(commit_sha: str, commit_message: Optional[str]) -> str:
+    """Build the "Commit: <sha> - <msg>" suffix for a details line.
+
+    Memoized: the commit behind a deploy never changes, so the slicing
+    and truncation run once per deploy rather than on every refresh.
+    """
+    fragment = f"\n   Commit: [cyan]{commit_sha[:7]}[/]"
+    if commit_message:
+        # First line only: str.find slices once instead of split
+        # allocating a list of every line in the message body
+        nl = commit_message.find('\n')
+        msg = commit_message if nl == -1 else commit_message[:nl]
+        # Truncate long commit messages
+        if len(msg) > 60:
+            msg = msg[:57] + "..."
+        fragment += f" - {msg}"
+    return fragment
 
 
 class ServiceCard(Container):
@@ -67,28 +160,36 @@ class ServiceCard(Container):
         """
         super().__init__(*args, **kwargs)
         self.service = service
+        # Cached for the search filter: the app matches its compiled query
+        # regex against this instead of re-lowercasing the name on every
+        # keystroke
+        self._name_lower = service.name.lower()
+        # Last rendered time-ago string; lets unchanged-state refreshes
+        # skip reformatting until the display crosses a bucket ("2m ago")
+        self._last_ago: str = ""
+        # Epoch time at which the rendered bucket next rolls over; ticks
+        # before then skip the card without formatting anything
+        self._next_change_ts: float = 0.0
+        # (deploy id, deploy status, time-ago bucket) behind the last
+        # details render; matching keys skip the format and the update
+        self._last_details_bucket: Optional[tuple] = None
+        # Inputs behind the last header render, same skip strategy
+        self._last_header_key: Optional[tuple] = None
+        # Child widget handles cached at mount; query_one walks the DOM
+        self._header: Optional[Static] = None
+        self._details: Optional[Static] = None
+        # Final details string last pushed to Textual; the cheapest
+        # possible no-op guard when the input keys can't tell
+        self._last_details_text: str = ""
         self.can_focus = True
 
     def compose(self) -> ComposeResult:
         """Compose the service card layout."""
         # Header with name and status
-        status_emoji = self.service.get_status_emoji()
-
-        # Map status to Rich color names
-        status_colors = {
-            "available": "green",
-            "deploying": "yellow",
-            "failed": "red",
-            "suspended": "bright_black",
-            "unknown": "white"
-        }
-        status_color = status_colors.get(self.service.status.value, "white")
-
-        header_text = f"{self.service.name}"
-        status_text = f"[{status_color}]{status_emoji} {self.service.status.value.title()}[/]"
+        status_text = _STATUS_MARKUP.get(self.service.status.value, _STATUS_MARKUP["unknown"])
 
         yield Static(
-            f"{header_text}  {status_text}  [dim]{self.service.id}[/]",
+            f"{self.service.name}  {status_text}  [dim]{self.service.id}[/]",
             classes="service-header",
             id="header"
         )
@@ -96,80 +197,140 @@ class ServiceCard(Container):
         # Details line (deploy info)
         details = self._format_details()
         if details:
-            yield Static(details, classes="service-details")
+            yield Static(details, classes="service-details", id="details")
 
         # Actions (highlight action keys without brackets to avoid markup issues)
-        yield Static(
-            "[bold cyan]L[/]ogs | [bold cyan]E[/]vents | [bold cyan]M[/]etrics | En[bold cyan]v[/] | [bold cyan]S[/]ettings",
-            classes="service-actions"
-        )
+        yield Static(_ACTIONS_TEXT, classes="service-actions", id="actions")
 
-    def _format_details(self) -> str:
-        """Format deploy details line."""
+    def _format_details(self, now: Optional[float] = None) -> str:
+        """Format deploy details line.
+
+        Args:
+            now: Current epoch seconds, shared across cards updated in
+                the same refresh pass
+        """
         from ..utils import time_ago
 
         if not self.service.latest_deploy:
             return "└─ No deployments"
 
         deploy = self.service.latest_deploy
-        ago = time_ago(deploy.created_at)
+        ago = time_ago(deploy.created_at, now)
+        self._last_ago = ago
 
         # Build details string with commit hash if available
         if deploy.is_in_progress:
-            details = f"└─ Deploy started: {ago}"
+            details = _DETAILS_IN_PROGRESS % ago
         else:
-            details = f"└─ Last deploy: {ago} ({deploy.status.value})"
+            details = _DETAILS_COMPLETED % (ago, deploy.status.value)
 
         # Add commit hash on a second line if available
         if deploy.commit_sha:
-            short_sha = deploy.commit_sha[:7]
-            details += f"\n   Commit: [cyan]{short_sha}[/]"
-            if deploy.commit_message:
-                # Truncate long commit messages
-                msg = deploy.commit_message.split('\n')[0]  # First line only
-                if len(msg) > 60:
-                    msg = msg[:57] + "..."
-                details += f" - {msg}"
+            details += _format_commit_fragment(deploy.commit_sha, deploy.commit_message)
 
         return details
 
+    def refresh_time_ago(self, now: Optional[float] = None) -> None:
+        """Repaint the details line only if its time-ago text changed.
+
+        Called for services whose fetched state matched the previous
+        refresh: everything but the relative timestamp is known to be
+        identical, so this skips all work until "2m ago" becomes
+        "3m ago".
+
+        Args:
+            now: Current epoch seconds, shared across cards updated in
+                the same refresh pass
+        """
+        from ..utils import time_ago, time_ago_next_change
+
+        deploy = self.service.latest_deploy
+        if not deploy:
+            return
+        if now is not None and now < self._next_change_ts:
+            # Bucket can't have rolled over yet
+            return
+        ago = time_ago(deploy.created_at, now)
+        self._next_change_ts = time_ago_next_change(deploy.created_at, now)
+        if ago == self._last_ago:
+            return
+        details = self._format_details(now)
+        if details == self._last_details_text:
+            return
+        if self._details is not None:
+            self._details.update(details)
+            self._last_details_text = details
+            self._last_details_bucket = (deploy.id, deploy.status, ago)
+
     def update_service(self, service: Service) -> None:
         """Update the service data and refresh display.
 
+        Mutates the existing child widgets in place; the details line is
+        only mounted/removed when its presence actually changes, so a
+        routine refresh never pays for widget teardown or layout.
+
         Args:
             service: Updated service data
         """
+        if service == self.service:
+            # Frozen dataclass equality: nothing displayed can differ
+            return
+
         self.service = service
+        self._name_lower = service.name.lower()
+        # New deploy data invalidates the scheduled bucket boundary
+        self._next_change_ts = 0.0
         # Update existing widgets instead of recreating
         self._update_header_display()
 
-        # Update details if they exist
-        try:
-            details = self.query_one(".service-details", Static)
-            details.update(self._format_details())
-        except Exception:
-            # Details widget doesn't exist, skip
-            pass
+        # Everything in the details line is a function of the deploy and
+        # the rendered time bucket; an unchanged key skips the f-string
+        # building and the Static re-render
+        from ..utils import time_ago
+
+        deploy = service.latest_deploy
+        bucket_key: Optional[tuple] = None
+        if deploy is not None:
+            bucket_key = (deploy.id, deploy.status, time_ago(deploy.created_at))
+            if bucket_key == self._last_details_bucket:
+                return
+        self._last_details_bucket = bucket_key
+
+        details = self._format_details()
+        details_widget = self._details
+
+        if details:
+            if details_widget is not None:
+                # Identical final string: skip the markup reparse
+                if details != self._last_details_text:
+                    details_widget.update(details)
+                    self._last_details_text = details
+            else:
+                # Details appeared (first deploy); insert above the actions line
+                widget = Static(details, classes="service-details", id="details")
+                self.mount(widget, before=self.query_one("#actions", Static))
+                self._details = widget
+                self._last_details_text = details
+        elif details_widget is not None:
+            details_widget.remove()
+            self._details = None
+            self._last_details_text = ""
 
     def _update_header_display(self) -> None:
         """Update header with selection indicator."""
-        # Check if widget is mounted and has children
-        try:
-            header = self.query_one("#header", Static)
-        except Exception:
-            # Widget not ready yet, skip update
+        # Everything in the header derives from these; an unchanged key
+        # skips the formatting and Textual's markup reparse
+        key = (self.service.status.value, self.has_focus, self.service.id, self.service.name)
+        if key == self._last_header_key:
+            return
+
+        header = self._header
+        if header is None:
+            # Widget not mounted yet, skip update
             return
+        self._last_header_key = key
 
-        status_emoji = self.service.get_status_emoji()
-        status_colors = {
-            "available": "green",
-            "deploying": "yellow",
-            "failed": "red",
-            "suspended": "bright_black",
-            "unknown": "white"
-        }
-        status_color = status_colors.get(self.service.status.value, "white")
-        status_text = f"[{status_color}]{status_emoji} {self.service.status.value.title()}[/]"
+        status_text = _STATUS_MARKUP.get(self.service.status.value, _STATUS_MARKUP["unknown"])
 
         # Add selection indicator when focused
         if self.has_focus:
@@ -183,33 +344,34 @@ class ServiceCard(Container):
 
     def on_mount(self) -> None:
         """Called when widget is mounted."""
+        self._header = self.query_one("#header", Static)
+        try:
+            self._details = self.query_one("#details", Static)
+        except Exception:
+            # Card composed without a details line
+            self._details = None
         # Initial display update
         self._update_header_display()
 
     def on_focus(self) -> None:
         """Handle focus event."""
+        # Push the id to the app so action handlers read an attribute
+        # instead of walking the focus chain with isinstance checks
+        self.app.focused_service_id = self.service.id
         self._update_header_display()
 
     def on_blur(self) -> None:
         """Handle blur event."""
+        if getattr(self.app, "focused_service_id", None) == self.service.id:
+            self.app.focused_service_id = None
         self._update_header_display()
 
     async def on_key(self, event) -> None:
         """Handle key presses when focused."""
-        key = event.key.lower()
-
-        action_map = {
-            "l": "logs",
-            "e": "events",
-            "m": "metrics",
-            "v": "env_vars",
-            "s": "settings",
-        }
-
-        if key in action_map:
-            self.post_message(
-                self.ServiceSelected(self.service.id, action_map[key])
-            )
+        action = _ACTION_MAP.get(event.key.lower())
+
+        if action is not None:
+            self.post_message(self.ServiceSelected(self.service.id, action))
             event.prevent_default()
             event.stop()
 
@@ -228,8 +390,15 @@ class StatusBar(Static):
 
     def __init__(self, *args, **kwargs) -> None:
         super().__init__("", *args, **kwargs)
-        self.last_update: Optional[datetime] = None
+        # Monotonic float instead of datetime: the per-second refresh then
+        # costs one clock read, not two datetime allocations and a timedelta
+        self.last_update: Optional[float] = None
         self.is_loading: bool = False
+        # Last rendered status text; identical ticks skip the re-render
+        self._last_text: str = ""
+        self._timer = None
+        # Once the display is minute-granular a 30s tick is plenty
+        self._slow_tick: bool = False
 
     def set_loading(self, loading: bool) -> None:
         """Set loading state."""
@@ -238,18 +407,22 @@ class StatusBar(Static):
 
     def update_time(self) -> None:
         """Update the last update timestamp."""
-        self.last_update = datetime.now()
+        self.last_update = time.monotonic()
         self.is_loading = False
+        if self._slow_tick and self._timer is not None:
+            # Fresh update: back to the fast tick for sub-minute display
+            self._timer.stop()
+            self._timer = self.set_interval(2.0, self._refresh_text)
+            self._slow_tick = False
         self._refresh_text()
 
     def _refresh_text(self) -> None:
         """Refresh the status bar text."""
+        seconds_ago = 0
         if self.is_loading:
             text = "[bold yellow]⟳ Loading...[/]"
         elif self.last_update:
-            now = datetime.now()
-            delta = now - self.last_update
-            seconds_ago = int(delta.total_seconds())
+            seconds_ago = int(time.monotonic() - self.last_update)
 
             # Round to nearest 5 second increment
             seconds_ago = (seconds_ago // 5) * 5
@@ -267,17 +440,23 @@ class StatusBar(Static):
         else:
             text = "Loading..."
 
-        controls = (
-            "[bold cyan]R[/] Refresh | [bold cyan]Q[/] Quit | [bold cyan]/[/] Search | "
-            "[bold cyan]L[/] Logs | [bold cyan]E[/] Events | [bold cyan]M[/] Metrics | "
-            "[bold cyan]V[/] Env | [bold cyan]S[/] Settings"
-        )
-        # Pad to full width
-        self.update(f" {text}  |  {controls}")
+        # Once past a minute the text only changes every 60s; drop the
+        # tick rate so idle dashboards stop re-rendering every 2s
+        if seconds_ago >= 60 and not self._slow_tick and self._timer is not None:
+            self._timer.stop()
+            self._timer = self.set_interval(30.0, self._refresh_text)
+            self._slow_tick = True
+
+        # Most ticks produce the identical string; skip the render
+        if text == self._last_text:
+            return
+        self._last_text = text
+
+        self.update(_STATUS_TEMPLATE.format(text=text))
 
     def on_mount(self) -> None:
         """Set up periodic refresh of time display."""
-        self.set_interval(1.0, self._refresh_text)
+        self._timer = self.set_interval(2.0, self._refresh_text)
 
 
 class EnvVarsScreen(ModalScreen):
@@ -346,6 +525,15 @@ class EnvVarsScreen(ModalScreen):
         self.service_id = service_id
         self.env_vars = env_vars
         self.error = error
+        # Option ids are env var keys; resolving the highlight through
+        # this map keeps lookups correct under future sorting/filtering
+        self._by_key = {ev.key: ev for ev in env_vars}
+        # Textual fires repeated highlight events on focus changes; the
+        # detail panel only re-renders when the index actually moves
+        self._last_highlight: Optional[int] = None
+        # Widget handles cached at mount
+        self._option_list: Optional[OptionList] = None
+        self._detail: Optional[Static] = None
 
     def compose(self) -> ComposeResult:
         """Compose the modal layout."""
@@ -357,23 +545,27 @@ class EnvVarsScreen(ModalScreen):
             elif not self.env_vars:
                 yield Static("[yellow]No environment variables found[/]\n[dim]Press B to open in browser[/]", id="env-vars-list")
             else:
-                # Create OptionList with env var names
-                option_list = OptionList(id="env-vars-list")
-                for env_var in self.env_vars:
-                    option_list.add_option(Option(env_var.key, id=env_var.key))
-                yield option_list
+                # Create OptionList with env var names, passed to the
+                # constructor in one batch: per-add_option list mutation
+                # and reflow scheduling adds up at hundreds of vars
+                yield OptionList(
+                    *(Option(env_var.key, id=env_var.key) for env_var in self.env_vars),
+                    id="env-vars-list",
+                )
 
             if self.env_vars:
                 yield Static("Select a variable and press [bold cyan]C[/] to copy", id="env-var-detail")
 
             if not self.env_vars and not self.error:
-                yield Static("[bold]ESC[/] Close | [bold]B[/] Open in Browser", id="env-vars-footer")
+                yield Static(_FOOTER_BROWSE_TEXT, id="env-vars-footer")
             else:
-                yield Static("[bold]ESC[/] Close | [bold]↑↓[/] Navigate | [bold]C[/] Copy | [bold]B[/] Browser", id="env-vars-footer")
+                yield Static(_FOOTER_FULL_TEXT, id="env-vars-footer")
 
     def on_mount(self) -> None:
         """When mounted, show first env var if available."""
-        if self.env_vars:
+        if self.env_vars and not self.error:
+            self._option_list = self.query_one("#env-vars-list", OptionList)
+            self._detail = self.query_one("#env-var-detail", Static)
             self._update_detail_panel()
 
     def on_option_list_option_highlighted(self, event: OptionList.OptionHighlighted) -> None:
@@ -382,51 +574,51 @@ class EnvVarsScreen(ModalScreen):
 
     def _update_detail_panel(self) -> None:
         """Update the detail panel with selected env var value."""
+        option_list = self._option_list
+        detail = self._detail
+        if option_list is None or detail is None:
+            return
+
+        highlighted = option_list.highlighted
+        if highlighted == self._last_highlight:
+            return
+        self._last_highlight = highlighted
+
+        env_var = self._env_var_at(highlighted)
+        if env_var is not None:
+            # Show full value in detail panel
+            detail.update(f"[bold cyan]{env_var.key}[/]\n{env_var.value}")
+        else:
+            detail.update("Select a variable")
+
+    def _env_var_at(self, index: Optional[int]):
+        """Resolve a highlighted index to its EnvVar via the option id."""
+        if index is None or self._option_list is None:
+            return None
         try:
-            option_list = self.query_one("#env-vars-list", OptionList)
-            detail = self.query_one("#env-var-detail", Static)
-
-            if option_list.highlighted is not None and self.env_vars:
-                # Find the env var by index
-                if option_list.highlighted < len(self.env_vars):
-                    env_var = self.env_vars[option_list.highlighted]
-                    # Show full value in detail panel
-                    detail.update(f"[bold cyan]{env_var.key}[/]\n{env_var.value}")
-                else:
-                    detail.update("Select a variable")
-            else:
-                detail.update("Select a variable")
+            option = self._option_list.get_option_at_index(index)
         except Exception:
-            pass
+            return None
+        return self._by_key.get(option.id)
 
     def action_copy_value(self) -> None:
         """Copy selected env var value to clipboard."""
+        option_list = self._option_list
+        detail = self._detail
+        if option_list is None or detail is None:
+            return
         try:
-            option_list = self.query_one("#env-vars-list", OptionList)
-            detail = self.query_one("#env-var-detail", Static)
-
-            if option_list.highlighted is not None and option_list.highlighted < len(self.env_vars):
-                env_var = self.env_vars[option_list.highlighted]
-
-                # Try to copy to clipboard using pbcopy (macOS) or xclip (Linux)
-                import subprocess
-                import platform
-
-                try:
-                    if platform.system() == "Darwin":
-                        # macOS
-                        process = subprocess.Popen(['pbcopy'], stdin=subprocess.PIPE)
-                        process.communicate(env_var.value.encode('utf-8'))
-                        detail.update(f"[bold green]✓ Copied {env_var.key}[/]\n{env_var.value}")
-                    elif platform.system() == "Linux":
-                        # Linux
-                        process = subprocess.Popen(['xclip', '-selection', 'clipboard'], stdin=subprocess.PIPE)
-                        process.communicate(env_var.value.encode('utf-8'))
-                        detail.update(f"[bold green]✓ Copied {env_var.key}[/]\n{env_var.value}")
-                    else:
-                        detail.update(f"[yellow]Copy not supported on {platform.system()}[/]\nValue: {env_var.value}")
-                except FileNotFoundError:
+            env_var = self._env_var_at(option_list.highlighted)
+            if env_var is not None:
+                # Copy via the clipboard helper resolved at import
+                if _CLIP_CMD is not None:
+                    process = subprocess.Popen(_CLIP_CMD, stdin=subprocess.PIPE)
+                    process.communicate(env_var.value.encode('utf-8'))
+                    detail.update(f"[bold green]✓ Copied {env_var.key}[/]\n{env_var.value}")
+                elif _PLATFORM in ("Darwin", "Linux"):
                     detail.update(f"[yellow]Clipboard tool not found[/]\nValue: {env_var.value}")
+                else:
+                    detail.update(f"[yellow]Copy not supported on {_PLATFORM}[/]\nValue: {env_var.value}")
         except Exception as e:
             self.log.error(f"Error copying: {e}")
 
@@ -436,7 +628,6 @@ class EnvVarsScreen(ModalScreen):
 
     def action_open_browser(self) -> None:
         """Open environment variables page in browser."""
-        import webbrowser
         url = f"https://dashboard.render.com/web/{self.service_id}/env"
         try:
             webbrowser.open(url)
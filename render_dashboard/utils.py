@@ -1,29 +1,105 @@
 """Shared utility functions."""
-from datetime import datetime, timezone
+import time
+from datetime import datetime
+from functools import lru_cache
+from typing import Optional
 
+# Shared clock with 1s granularity: callers that format many timestamps
+# close together (cards, status bar ticks) read one cached epoch value
+# instead of hitting the system clock per call
+_now_mono: float = 0.0
+_now_epoch: float = 0.0
 
-def time_ago(dt: datetime) -> str:
+
+def cached_now() -> float:
+    """Return epoch seconds, recomputed at most once per second.
+
+    Sub-second staleness is invisible at the display granularity used
+    here ("5s ago" and coarser).
+    """
+    global _now_mono, _now_epoch
+    mono = time.monotonic()
+    if mono - _now_mono >= 1.0:
+        _now_mono = mono
+        _now_epoch = time.time()
+    return _now_epoch
+
+
+# Unit thresholds, largest first; the formatter walks this instead of a
+# branch chain so adding a unit is a table edit
+_UNITS = ((86400, "d"), (3600, "h"), (60, "m"))
+
+# Epoch references for converting datetimes to epoch seconds without
+# materializing a replacement tz-aware datetime per call
+_EPOCH_NAIVE = datetime(1970, 1, 1)
+
+
+def time_ago_next_change(dt: datetime, now: Optional[float] = None) -> float:
+    """Return the epoch time at which time_ago(dt) will next change.
+
+    Lets callers skip re-rendering a relative timestamp until its
+    displayed bucket actually rolls over, instead of re-checking on a
+    fixed cadence.
+
+    Args:
+        dt: Datetime the display is relative to (naive assumed UTC)
+        now: Current epoch seconds; defaults to the precise clock
+    """
+    if dt.tzinfo is None:
+        ts = (dt - _EPOCH_NAIVE).total_seconds()
+    else:
+        ts = dt.timestamp()
+    if now is None:
+        now = time.time()
+
+    delta = int(now - ts)
+    step = 1
+    for secs, _suffix in _UNITS:
+        if delta >= secs:
+            step = secs
+            break
+    return now + (step - delta % step)
+
+
+@lru_cache(maxsize=256)
+def _format_delta(delta_s: int) -> str:
+    """Format a second delta as "X ago"; memoized per distinct delta.
+
+    Cards refreshed in the same pass share one clock reading, so every
+    service deployed at the same moment hits the cache instead of
+    rebuilding an identical f-string.
+    """
+    for secs, suffix in _UNITS:
+        if delta_s >= secs:
+            return f"{delta_s // secs}{suffix} ago"
+    return f"{delta_s}s ago"
+
+
+def time_ago(dt: datetime, now: Optional[float] = None) -> str:
     """Format a datetime as a human-readable 'X ago' string.
 
     Args:
         dt: Datetime to format (naive datetimes assumed UTC)
+        now: Current epoch seconds; callers formatting many timestamps
+            for the same moment can pass one time.time() reading
 
     Returns:
         Human-readable time string like "5m ago", "2h ago", "3d ago"
     """
-    now = datetime.now(timezone.utc)
-
-    # Make naive datetime aware (assume UTC)
+    # Naive datetimes are assumed UTC: subtracting the naive epoch gives
+    # the same result as replace(tzinfo=utc).timestamp() without
+    # allocating a second datetime or doing a timezone conversion
     if dt.tzinfo is None:
-        dt = dt.replace(tzinfo=timezone.utc)
+        ts = (dt - _EPOCH_NAIVE).total_seconds()
+    else:
+        ts = dt.timestamp()
 
-    delta = now - dt
+    if now is None:
+        # Precise clock by default: a cached reading can lag by up to a
+        # second, which shifts bucket boundaries ("2d ago" -> "1d ago")
+        # for timestamps taken just after the cache refreshed
+        now = time.time()
 
-    if delta.days > 0:
-        return f"{delta.days}d ago"
-    elif delta.seconds >= 3600:
-        return f"{delta.seconds // 3600}h ago"
-    elif delta.seconds >= 60:
-        return f"{delta.seconds // 60}m ago"
-    else:
-        return f"{delta.seconds}s ago"
+    # Integer epoch math from here: no datetime arithmetic and no
+    # .days/.seconds field splitting
+    return _format_delta(int(now - ts))
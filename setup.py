@@ -12,10 +12,10 @@ setup(
     long_description=long_description,
     long_description_content_type="text/markdown",
     packages=find_packages(),
-    python_requires=">=3.9",
+    python_requires=">=3.10",
     install_requires=[
         "textual>=0.47.0",
-        "httpx>=0.25.0",
+        "httpx[http2]>=0.25.0",
         "pyyaml>=6.0",
         "python-dateutil>=2.8.0",
     ],
@@ -28,7 +28,6 @@ setup(
         "Development Status :: 3 - Alpha",
         "Intended Audience :: Developers",
         "Programming Language :: Python :: 3",
-        "Programming Language :: Python :: 3.9",
         "Programming Language :: Python :: 3.10",
         "Programming Language :: Python :: 3.11",
         "Programming Language :: Python :: 3.12",
@@ -0,0 +1,16 @@
+"""Shared test fixtures."""
+import pytest
+
+from render_dashboard import config as config_module
+
+
+@pytest.fixture(autouse=True)
+def _isolated_config_cache(tmp_path, monkeypatch):
+    """Keep the pickled config cache out of the real home directory.
+
+    Any test that calls load_config would otherwise persist its fixture
+    API keys to ~/.cache; point the cache at a per-test path instead.
+    """
+    monkeypatch.setattr(
+        config_module, "_CONFIG_CACHE_PATH", tmp_path / "config-cache" / "config.pkl"
+    )
@@ -6,6 +6,7 @@ from pathlib import Path
 import pytest
 import yaml
 
+from render_dashboard import config as config_module
 from render_dashboard.config import (
     load_config,
     find_service_by_alias,
@@ -112,6 +113,66 @@ class TestLoadConfig:
         assert len(config.services) == 0
 
 
+class TestConfigCache:
+    """Tests for the pickled parsed-config cache."""
+
+    @pytest.fixture
+    def cache_path(self, monkeypatch):
+        """Expose the per-test cache file (isolated suite-wide in conftest)."""
+        monkeypatch.delenv("RDASH_NO_CACHE", raising=False)
+        return config_module._CONFIG_CACHE_PATH
+
+    def _write_config(self, config_file, api_key="test-key", refresh_interval=30):
+        config_file.write_text(yaml.dump({
+            "render": {
+                "api_key": api_key,
+                "refresh_interval": refresh_interval,
+            },
+            "services": [
+                {"id": "srv-123", "name": "Test", "aliases": ["test"]},
+            ],
+        }))
+
+    def test_cache_hit_skips_yaml_parse(self, tmp_path, cache_path, monkeypatch):
+        """Test that an unchanged file is served from the cache."""
+        config_file = tmp_path / "config.yaml"
+        self._write_config(config_file)
+
+        first = load_config(config_file)
+        assert cache_path.exists()
+
+        def fail_parse(*args, **kwargs):
+            raise AssertionError("YAML parsed on warm load")
+
+        monkeypatch.setattr(config_module.yaml, "load", fail_parse)
+        second = load_config(config_file)
+        assert second.render.api_key == first.render.api_key
+        assert [s.id for s in second.services] == ["srv-123"]
+
+    def test_cache_invalidated_on_mtime_change(self, tmp_path, cache_path):
+        """Test that touching the file forces a re-parse."""
+        config_file = tmp_path / "config.yaml"
+        self._write_config(config_file, refresh_interval=30)
+        assert load_config(config_file).render.refresh_interval == 30
+
+        self._write_config(config_file, refresh_interval=60)
+        # Make the mtime change unambiguous even on coarse filesystems
+        st = os.stat(config_file)
+        os.utime(config_file, ns=(st.st_atime_ns, st.st_mtime_ns + 10_000_000))
+
+        assert load_config(config_file).render.refresh_interval == 60
+
+    def test_cache_invalidated_on_env_change(self, tmp_path, cache_path, monkeypatch):
+        """Test that changing a substituted env var forces a re-parse."""
+        monkeypatch.setenv("TEST_API_KEY", "old-key")
+        config_file = tmp_path / "config.yaml"
+        self._write_config(config_file, api_key="${TEST_API_KEY}")
+        assert load_config(config_file).render.api_key == "old-key"
+
+        monkeypatch.setenv("TEST_API_KEY", "new-key")
+        assert load_config(config_file).render.api_key == "new-key"
+
+
 class TestFindServiceByAlias:
     """Tests for find_service_by_alias function."""
 
@@ -1,7 +1,9 @@
 """Tests for utility functions."""
+import time
 from datetime import datetime, timezone, timedelta
 
-from render_dashboard.utils import time_ago
+from render_dashboard import utils
+from render_dashboard.utils import cached_now, time_ago, time_ago_next_change
 
 
 class TestTimeAgo:
@@ -37,3 +39,76 @@ class TestTimeAgo:
         """Test edge case of 0 seconds."""
         dt = datetime.now(timezone.utc)
         assert time_ago(dt) == "0s ago"
+
+    def test_explicit_now(self):
+        """Test that a caller-supplied clock reading is honored."""
+        now = 1_000_000.0
+        dt = datetime.fromtimestamp(now - 300, tz=timezone.utc)
+        assert time_ago(dt, now=now) == "5m ago"
+
+
+class TestTimeAgoNextChange:
+    """Tests for time_ago_next_change function."""
+
+    NOW = 1_000_000.0
+
+    def _dt(self, delta_s):
+        return datetime.fromtimestamp(self.NOW - delta_s, tz=timezone.utc)
+
+    def test_sub_minute_changes_every_second(self):
+        """Test that deltas under a minute roll over each second."""
+        assert time_ago_next_change(self._dt(30), self.NOW) == self.NOW + 1
+
+    def test_minute_bucket(self):
+        """Test rollover at the next minute boundary."""
+        # 2m30s ago -> "2m ago" becomes "3m ago" in 30s
+        assert time_ago_next_change(self._dt(150), self.NOW) == self.NOW + 30
+
+    def test_hour_bucket(self):
+        """Test rollover at the next hour boundary."""
+        # 1h30m ago -> "1h ago" becomes "2h ago" in 30m
+        assert time_ago_next_change(self._dt(5400), self.NOW) == self.NOW + 1800
+
+    def test_day_bucket(self):
+        """Test rollover at the next day boundary."""
+        # 2d1h ago -> "2d ago" becomes "3d ago" in 23h
+        delta = 2 * 86400 + 3600
+        expected = self.NOW + (86400 - 3600)
+        assert time_ago_next_change(self._dt(delta), self.NOW) == expected
+
+    def test_display_changes_exactly_at_boundary(self):
+        """Test that the string is stable before the boundary, new at it."""
+        dt = self._dt(119)  # 1m59s ago
+        assert time_ago(dt, now=self.NOW) == "1m ago"
+        boundary = time_ago_next_change(dt, self.NOW)
+        assert time_ago(dt, now=boundary - 0.5) == "1m ago"
+        assert time_ago(dt, now=boundary) == "2m ago"
+
+    def test_naive_datetime_assumed_utc(self):
+        """Test that naive datetimes match their tz-aware equivalent."""
+        aware = self._dt(150)
+        naive = aware.replace(tzinfo=None)
+        assert time_ago_next_change(naive, self.NOW) == time_ago_next_change(
+            aware, self.NOW
+        )
+
+
+class TestCachedNow:
+    """Tests for the shared 1s-granularity clock."""
+
+    def test_tracks_system_clock(self, monkeypatch):
+        """Test that a fresh reading is close to time.time()."""
+        monkeypatch.setattr(utils, "_now_mono", 0.0)  # force a refresh
+        assert abs(cached_now() - time.time()) < 2.0
+
+    def test_stable_within_window(self, monkeypatch):
+        """Test that back-to-back calls share one reading."""
+        monkeypatch.setattr(utils, "_now_mono", 0.0)
+        first = cached_now()
+        assert cached_now() == first
+
+    def test_refreshes_after_window(self, monkeypatch):
+        """Test that a reading older than a second is replaced."""
+        monkeypatch.setattr(utils, "_now_mono", time.monotonic() - 2.0)
+        monkeypatch.setattr(utils, "_now_epoch", 123.0)
+        assert cached_now() != 123.0